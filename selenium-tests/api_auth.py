@@ -0,0 +1,118 @@
+# API Login Fast Path
+# Logs in through POST /api/auth/login once per worker and injects the session into
+# localStorage exactly like public/auth.js does, so tests can skip the login form.
+# Tokens are also kept in CACHE_DIR until they expire, so later runs skip the login too.
+import base64
+import json
+import threading
+import time
+from api_client import get_session
+from cache_store import load_json, save_json
+from config import TestConfig
+from http_replay import replay_mode
+
+# Refresh the token this many seconds before the server-side expiry
+EXPIRY_MARGIN = 60
+TOKEN_CACHE_FILE = 'auth_tokens.json'
+
+_tokens = {}
+_lock = threading.Lock()
+
+
+def decode_jwt_expiry(token):
+    """Return the 'exp' claim of a JWT as a unix timestamp (the signature is not verified)"""
+    payload = token.split('.')[1]
+    payload += '=' * (-len(payload) % 4)
+    return json.loads(base64.urlsafe_b64decode(payload)).get('exp', 0)
+
+
+def _token_cache_key(username):
+    # A token is only good for the server that issued it
+    return f"{TestConfig.API_BASE_URL} {username}"
+
+
+def _persistence_enabled():
+    # Replayed runs must not send the extra /auth/me check the recordings do not contain
+    return TestConfig.AUTH_TOKEN_CACHE and replay_mode() == 'off'
+
+
+def load_persisted_session(username):
+    """Token saved by an earlier run, if it is still valid on the server; otherwise None"""
+    if not _persistence_enabled():
+        return None
+    session = load_json(TOKEN_CACHE_FILE).get(_token_cache_key(username))
+    if not session or session['expires_at'] - EXPIRY_MARGIN <= time.time():
+        return None
+    # The server may have restarted with a new secret or a fresh database since
+    response = get_session().get(
+        f"{TestConfig.API_BASE_URL}/auth/me",
+        headers={'Authorization': f"Bearer {session['token']}"},
+        timeout=TestConfig.MEDIUM_WAIT,
+    )
+    return session if response.status_code == 200 else None
+
+
+def _persist_session(username, session):
+    if not _persistence_enabled():
+        return
+    tokens = {key: saved for key, saved in load_json(TOKEN_CACHE_FILE).items()
+              if saved['expires_at'] > time.time()}
+    if session is None:
+        tokens.pop(_token_cache_key(username), None)
+    else:
+        tokens[_token_cache_key(username)] = session
+    save_json(TOKEN_CACHE_FILE, tokens)
+
+
+def get_auth_session(username=None, password=None):
+    """Return {'token', 'user', 'expires_at'} for the user, logging in only when needed"""
+    username = username or TestConfig.ADMIN_USERNAME
+    password = password or TestConfig.ADMIN_PASSWORD
+
+    with _lock:
+        cached = _tokens.get(username)
+        if cached and cached['expires_at'] - EXPIRY_MARGIN > time.time():
+            return cached
+        persisted = load_persisted_session(username)
+        if persisted:
+            _tokens[username] = persisted
+            return persisted
+
+        response = get_session().post(
+            f"{TestConfig.API_BASE_URL}/auth/login",
+            json={'username': username, 'password': password},
+            timeout=TestConfig.MEDIUM_WAIT,
+        )
+        if response.status_code != 200:
+            raise AssertionError(f"API login for '{username}' failed: {response.status_code} {response.text}")
+
+        data = response.json()
+        session = {
+            'token': data['token'],
+            'user': data['user'],
+            'expires_at': decode_jwt_expiry(data['token']),
+        }
+        _tokens[username] = session
+        _persist_session(username, session)
+        return session
+
+
+def invalidate(username=None):
+    """Forget a cached token (e.g. after the server rejected it), on disk as well"""
+    username = username or TestConfig.ADMIN_USERNAME
+    with _lock:
+        _tokens.pop(username, None)
+        _persist_session(username, None)
+
+
+def inject_session(driver, session):
+    """Store token and user in localStorage the same way public/auth.js does after login.
+
+    localStorage is per origin, so the browser must already be on a page of the app.
+    """
+    driver.execute_script(
+        "localStorage.setItem('token', arguments[0]);"
+        "localStorage.setItem('user', JSON.stringify(arguments[1]));",
+        session['token'],
+        session['user'],
+    )
@@ -0,0 +1,78 @@
+# Pooled REST Client for the Inventory API
+# One keep-alive requests.Session per worker, shared by the API test tier and helpers.
+import threading
+import requests
+from requests.adapters import HTTPAdapter
+from config import TestConfig
+from http_replay import ReplayAdapter, get_store, replay_mode
+from impact_map import tracker
+
+_session = None
+_lock = threading.Lock()
+
+
+def get_session():
+    """Return this worker's shared, connection-pooled requests.Session"""
+    global _session
+    with _lock:
+        if _session is None:
+            _session = requests.Session()
+            if replay_mode() != 'off':
+                adapter = ReplayAdapter(get_store(), replay_mode(),
+                                        pool_connections=4, pool_maxsize=TestConfig.API_POOL_SIZE)
+            else:
+                adapter = HTTPAdapter(pool_connections=4, pool_maxsize=TestConfig.API_POOL_SIZE)
+            _session.mount('http://', adapter)
+            _session.mount('https://', adapter)
+            # Test impact: remember which endpoints the current test called
+            _session.hooks['response'].append(tracker.note_response)
+        return _session
+
+
+class ApiClient:
+    """Thin wrapper around the endpoints in server.js; returns raw responses for assertions"""
+
+    def __init__(self, token=None, session=None):
+        self.session = session or get_session()
+        self.base_url = TestConfig.API_BASE_URL
+        self.token = token
+
+    def request(self, method, path, token=None, **kwargs):
+        headers = kwargs.pop('headers', {})
+        token = token or self.token
+        if token:
+            headers['Authorization'] = f'Bearer {token}'
+        kwargs.setdefault('timeout', TestConfig.MEDIUM_WAIT)
+        return self.session.request(method, f"{self.base_url}{path}", headers=headers, **kwargs)
+
+    def health(self):
+        return self.session.get(f"{TestConfig.BASE_URL}/health", timeout=TestConfig.MEDIUM_WAIT)
+
+    # Authentication
+    def register(self, username, email, password):
+        return self.request('POST', '/auth/register', json={'username': username, 'email': email, 'password': password})
+
+    def login(self, username, password):
+        return self.request('POST', '/auth/login', json={'username': username, 'password': password})
+
+    def me(self, token=None):
+        return self.request('GET', '/auth/me', token=token)
+
+    def logout(self, token=None):
+        return self.request('POST', '/auth/logout', token=token)
+
+    # Inventory
+    def list_items(self):
+        return self.request('GET', '/inventory')
+
+    def get_item(self, item_id):
+        return self.request('GET', f'/inventory/{item_id}')
+
+    def create_item(self, item):
+        return self.request('POST', '/inventory', json=item)
+
+    def update_item(self, item_id, item):
+        return self.request('PUT', f'/inventory/{item_id}', json=item)
+
+    def delete_item(self, item_id):
+        return self.request('DELETE', f'/inventory/{item_id}')
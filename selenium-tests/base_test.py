@@ -7,37 +7,159 @@ from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.chrome.service import Service as ChromeService
 from selenium.webdriver.firefox.service import Service as FirefoxService
 from selenium.webdriver.edge.service import Service as EdgeService
-from webdriver_manager.chrome import ChromeDriverManager
-from webdriver_manager.firefox import GeckoDriverManager
-from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from selenium.common.exceptions import TimeoutException
+from api_auth import get_auth_session, inject_session
+from api_client import get_session
+from browser_contexts import close_context, open_context, open_home_window, supports_contexts
+from browser_resources import browser_rss_mb
 from config import TestConfig
+from driver_cache import resolve_driver_path
+from driver_pool import get_pool
+from http_replay import browser_replay_script, collect_browser_traffic, get_store, replay_mode
+from impact_map import IMPACT_TRACKER_JS, tracker
+from locators import get_registry, query_presence
+from network_capture import (LOGGING_PREFS, drain_performance_log, format_breakdown,
+                             parse_performance_log, summarize_by_endpoint)
+from profiling import TestProfile, instrument_driver, profiled
+from screenshot_service import get_screenshot_service
+from contextlib import contextmanager
+import os
 import time
-import requests
+
+# Counts in-flight fetch() calls (InventoryManager and auth.js use fetch for every API call)
+FETCH_TRACKER_JS = """
+if (window.__pendingFetches === undefined) {
+    window.__pendingFetches = 0;
+    window.__lastFetchSettled = 0;
+    const originalFetch = window.fetch;
+    window.fetch = function() {
+        window.__pendingFetches++;
+        return originalFetch.apply(this, arguments).finally(() => {
+            window.__pendingFetches--;
+            window.__lastFetchSettled = performance.now();
+        });
+    };
+}
+"""
+
+# Page is settled: loaded, no fetch in flight or just finished, no inventory loading placeholder
+NETWORK_IDLE_JS = """
+return document.readyState === 'complete'
+    && (window.__pendingFetches || 0) === 0
+    && performance.now() - (window.__lastFetchSettled || 0) > arguments[0]
+    && !document.querySelector(arguments[1]);
+"""
+
+DOM_WATCH_JS = """
+if (window.__domObserver) { window.__domObserver.disconnect(); }
+window.__domChanged = false;
+const target = document.querySelector(arguments[0]);
+if (target) {
+    window.__domObserver = new MutationObserver(() => { window.__domChanged = true; });
+    window.__domObserver.observe(target, {childList: true, subtree: true, characterData: true});
+}
+"""
+
+# Quiet period after the last fetch settles, so response.json() and rendering can finish
+NETWORK_QUIET_MS = 100
+LOADING_SELECTOR = "#inventoryList .loading"
 
 class BaseTest:
     def setup_method(self):
         """Setup method called before each test"""
         self.config = TestConfig()
-        self.driver = self.get_driver()
+        self.profile = TestProfile()
+        self.phase_timings = {}
+        self.screenshots = []
+        self.network = None
+        self.browser_rss_mb = None
+        self.browser_context = None
+        started = time.time()
+        if self.config.REUSE_DRIVERS:
+            self.driver = get_pool().lease(self.get_driver)
+        else:
+            self.driver = self.get_driver()
+        if self.config.BROWSER_CONTEXTS and supports_contexts(self.driver):
+            # Isolation comes from a fresh context instead of a fresh (or reset) browser
+            self.browser_context = open_context(self.driver)
+            self.install_page_scripts(self.driver)
+        self.phase_timings['driver_start'] = round(time.time() - started, 3)
+        # Pooled drivers are shared across tests: point the round-trip timer at this one
+        instrument_driver(self.driver).active_profile = self.profile
         self.wait = WebDriverWait(self.driver, self.config.IMPLICIT_WAIT)
         
         # Set timeouts
         self.driver.implicitly_wait(self.config.IMPLICIT_WAIT)
         self.driver.set_page_load_timeout(self.config.PAGE_LOAD_TIMEOUT)
         
-        # Maximize window
-        self.driver.maximize_window()
+        # Maximize window (the lean profile keeps its fixed, smaller viewport)
+        if not self.lean_profile():
+            self.driver.maximize_window()
+        else:
+            self.driver.set_window_size(*self.lean_window_size())
+        
+        if self.captures_network():
+            # Discard requests made by earlier tests on this pooled browser
+            drain_performance_log(self.driver)
         
     def teardown_method(self):
         """Teardown method called after each test"""
+        print(f"⏱️ {self.profile.summary()}")
+        if hasattr(self, 'driver') and self.captures_network():
+            try:
+                self.network = summarize_by_endpoint(parse_performance_log(drain_performance_log(self.driver)))
+                for line in format_breakdown(self.network):
+                    print(f"🌐 {line}")
+            except Exception as e:
+                print(f"⚠️ Could not read the performance log: {e}")
+        # test_failed is set by the pytest_runtest_makereport hook in conftest.py
+        failed = getattr(self, 'test_failed', False)
+        if failed and hasattr(self, 'driver'):
+            try:
+                self.take_screenshot(f"failure_{self.__class__.__name__}")
+            except Exception as e:
+                print(f"⚠️ Could not capture failure screenshot: {e}")
+        self.screenshots = get_screenshot_service().end_test(failed)
+        for filename in self.screenshots:
+            print(f"Screenshot saved: {filename}")
+        if hasattr(self, 'driver') and replay_mode() != 'off':
+            try:
+                for key in collect_browser_traffic(self.driver, get_store()):
+                    print(f"⚠️ No recording for browser request {key}")
+            except Exception as e:
+                print(f"⚠️ Could not collect recorded browser traffic: {e}")
         if hasattr(self, 'driver'):
-            self.driver.quit()
+            try:
+                tracker.collect_browser(self.driver)
+            except Exception as e:
+                print(f"⚠️ Could not collect touched pages: {e}")
+            self.browser_rss_mb = browser_rss_mb(self.driver)
+            self.driver.active_profile = None
+            context_closed = False
+            if self.browser_context is not None:
+                try:
+                    context_closed = close_context(self.driver, self.browser_context)
+                except Exception as e:
+                    print(f"⚠️ Could not dispose of the browser context: {e}")
+            if self.config.REUSE_DRIVERS:
+                # A context that could not be disposed leaves state behind: retire the session
+                in_context = self.browser_context is not None
+                get_pool().release(self.driver, broken=in_context and not context_closed, reset=not in_context)
+            else:
+                self.driver.quit()
     
     def get_driver(self):
         """Initialize and return WebDriver based on configuration"""
         browser = self.config.BROWSER.lower()
         
-        if browser == 'chrome':
+        if browser in ('chrome', 'edge') and self.config.SHARED_BROWSER_ADDRESS:
+            # Attach to the shared browser; launch options belong to whoever started it
+            options = webdriver.ChromeOptions() if browser == 'chrome' else webdriver.EdgeOptions()
+            options.debugger_address = self.config.SHARED_BROWSER_ADDRESS
+            service_class, driver_class = ((ChromeService, webdriver.Chrome) if browser == 'chrome'
+                                           else (EdgeService, webdriver.Edge))
+            
+        elif browser == 'chrome':
             options = webdriver.ChromeOptions()
             if self.config.HEADLESS:
                 options.add_argument('--headless')
@@ -47,98 +169,270 @@ class BaseTest:
             options.add_argument('--disable-extensions')
             options.add_argument('--disable-web-security')
             options.add_argument('--allow-running-insecure-content')
-            
-            try:
-                # Try with webdriver-manager first
-                service = ChromeService(ChromeDriverManager().install())
-                return webdriver.Chrome(service=service, options=options)
-            except Exception as e:
-                print(f"⚠️ WebDriver Manager failed: {e}")
-                try:
-                    # Try without service (use system PATH)
-                    return webdriver.Chrome(options=options)
-                except Exception as e2:
-                    print(f"⚠️ System Chrome failed: {e2}")
-                    raise Exception("Chrome WebDriver setup failed. Please install Chrome and ensure it's in PATH.")
+            if self.config.NETWORK_CAPTURE:
+                options.set_capability('goog:loggingPrefs', LOGGING_PREFS)
+            if self.lean_profile():
+                self.apply_lean_chromium_options(options)
+            if self.config.REMOTE_DEBUGGING_PORT:
+                options.add_argument(f'--remote-debugging-port={self.config.REMOTE_DEBUGGING_PORT}')
+            service_class, driver_class = ChromeService, webdriver.Chrome
             
         elif browser == 'firefox':
             options = webdriver.FirefoxOptions()
             if self.config.HEADLESS:
                 options.add_argument('--headless')
-            service = FirefoxService(GeckoDriverManager().install())
-            return webdriver.Firefox(service=service, options=options)
+            if self.lean_profile():
+                self.apply_lean_firefox_options(options)
+            service_class, driver_class = FirefoxService, webdriver.Firefox
             
         elif browser == 'edge':
             options = webdriver.EdgeOptions()
             if self.config.HEADLESS:
                 options.add_argument('--headless')
-            service = EdgeService(EdgeChromiumDriverManager().install())
-            return webdriver.Edge(service=service, options=options)
+            if self.config.NETWORK_CAPTURE:
+                options.set_capability('ms:loggingPrefs', LOGGING_PREFS)
+            if self.lean_profile():
+                self.apply_lean_chromium_options(options)
+            if self.config.REMOTE_DEBUGGING_PORT:
+                options.add_argument(f'--remote-debugging-port={self.config.REMOTE_DEBUGGING_PORT}')
+            service_class, driver_class = EdgeService, webdriver.Edge
             
         else:
             raise ValueError(f"Unsupported browser: {browser}")
+        
+        # Driver binary is resolved once per worker and cached on disk across runs
+        driver_path = resolve_driver_path(browser)
+        started = time.time()
+        try:
+            driver = driver_class(service=service_class(driver_path), options=options)
+        except Exception as e:
+            print(f"⚠️ {browser} WebDriver startup failed: {e}")
+            raise Exception(f"{browser.capitalize()} WebDriver setup failed. Please install {browser} and ensure it's in PATH.")
+        print(f"🚀 {browser} started in {time.time() - started:.2f}s")
+        
+        if self.config.SHARED_BROWSER_ADDRESS and hasattr(driver, 'execute_cdp_cmd'):
+            open_home_window(driver)
+        self.install_page_scripts(driver)
+        return driver
+    
+    def install_page_scripts(self, driver):
+        """Chromium: register the page scripts for the current target (each new context needs its own)"""
+        if not hasattr(driver, 'execute_cdp_cmd'):
+            return
+        if replay_mode() != 'off':
+            # Installed first so the fetch tracker below also counts replayed calls
+            driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument',
+                                   {'source': browser_replay_script(get_store())})
+        # Record touched pages and API calls, and track fetch() from the first script on every page
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': IMPACT_TRACKER_JS})
+        driver.execute_cdp_cmd('Page.addScriptToEvaluateOnNewDocument', {'source': FETCH_TRACKER_JS})
+    
+    def lean_profile(self):
+        return self.config.BROWSER_PROFILE == 'lean'
+    
+    def lean_window_size(self):
+        width, height = self.config.LEAN_WINDOW_SIZE.split(',')
+        return int(width), int(height)
+    
+    def apply_lean_chromium_options(self, options):
+        """Resource-light Chrome/Edge: headless, no images, no background traffic, few renderers"""
+        width, height = self.lean_window_size()
+        if not self.config.HEADLESS:
+            options.add_argument('--headless=new')
+        options.add_argument(f'--window-size={width},{height}')
+        options.add_argument('--blink-settings=imagesEnabled=false')
+        options.add_experimental_option('prefs', {'profile.managed_default_content_settings.images': 2})
+        options.add_argument(f'--renderer-process-limit={self.config.RENDERER_PROCESS_LIMIT}')
+        options.add_argument(f'--disk-cache-dir={os.path.abspath(self.config.BROWSER_DISK_CACHE)}')
+        for flag in ('--disable-background-networking', '--disable-component-update', '--disable-sync',
+                     '--disable-default-apps', '--no-first-run', '--no-default-browser-check',
+                     '--metrics-recording-only', '--mute-audio', '--disable-features=Translate,MediaRouter'):
+            options.add_argument(flag)
+    
+    def apply_lean_firefox_options(self, options):
+        """Firefox equivalents of the lean Chromium profile"""
+        width, height = self.lean_window_size()
+        if not self.config.HEADLESS:
+            options.add_argument('--headless')
+        options.add_argument(f'--width={width}')
+        options.add_argument(f'--height={height}')
+        options.set_preference('permissions.default.image', 2)
+        options.set_preference('dom.ipc.processCount', self.config.RENDERER_PROCESS_LIMIT)
+        options.set_preference('browser.cache.disk.parent_directory', os.path.abspath(self.config.BROWSER_DISK_CACHE))
+        # Background networking off
+        options.set_preference('network.prefetch-next', False)
+        options.set_preference('network.dns.disablePrefetch', True)
+        options.set_preference('app.update.enabled', False)
+        options.set_preference('extensions.update.enabled', False)
+        options.set_preference('datareporting.healthreport.uploadEnabled', False)
+        options.set_preference('browser.safebrowsing.malware.enabled', False)
+        options.set_preference('browser.safebrowsing.phishing.enabled', False)
     
+    def captures_network(self):
+        """Network capture is opt-in (NETWORK_CAPTURE) and needs a Chromium performance log"""
+        return self.config.NETWORK_CAPTURE and hasattr(self.driver, 'execute_cdp_cmd')
+    
+    @profiled()
     def navigate_to(self, path=""):
-        """Navigate to a specific path"""
+        """Navigate to a specific path and wait until the page and its API calls have settled"""
         url = f"{self.config.BASE_URL}{path}"
         print(f"Navigating to: {url}")
         self.driver.get(url)
-        time.sleep(2)  # Allow page to load
+        # Non-Chromium browsers get the tracker after load; it still sees later fetches
+        if replay_mode() != 'off' and not hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_script(browser_replay_script(get_store()))
+        if not hasattr(self.driver, 'execute_cdp_cmd'):
+            self.driver.execute_script(IMPACT_TRACKER_JS)
+        self.driver.execute_script(FETCH_TRACKER_JS)
+        self.wait_for_network_idle()
     
-    def wait_for_element(self, locator, timeout=None):
-        """Wait for element to be present and visible"""
+    @profiled()
+    def login_via_api(self, username=None, password=None):
+        """Log in without the form: reuse this worker's cached JWT and inject it into localStorage"""
+        started = time.time()
+        session = get_auth_session(username, password)
+        if not self.driver.current_url.startswith(self.config.BASE_URL):
+            # localStorage is per origin, so load the lightest page the app serves first
+            self.driver.get(f"{self.config.BASE_URL}/health")
+        inject_session(self.driver, session)
+        self.phase_timings['login'] = round(self.phase_timings.get('login', 0) + time.time() - started, 3)
+        print(f"🔑 Logged in as {session['user']['username']} via API token")
+        return session
+    
+    def wait_until(self, name, condition, timeout=None):
+        """Wait for condition(driver) to be truthy, recording the wait under name in the profile"""
         if timeout is None:
             timeout = self.config.MEDIUM_WAIT
-        return WebDriverWait(self.driver, timeout).until(
-            EC.visibility_of_element_located(locator)
-        )
+        with self.profile.measure(name):
+            return WebDriverWait(self.driver, timeout).until(condition)
+    
+    def wait_for_element(self, locator, timeout=None):
+        """Wait for element to be present and visible"""
+        return self.wait_until('wait_for_element', EC.visibility_of_element_located(locator), timeout)
     
     def wait_for_clickable(self, locator, timeout=None):
         """Wait for element to be clickable"""
-        if timeout is None:
-            timeout = self.config.MEDIUM_WAIT
-        return WebDriverWait(self.driver, timeout).until(
-            EC.element_to_be_clickable(locator)
+        return self.wait_until('wait_for_clickable', EC.element_to_be_clickable(locator), timeout)
+    
+    def wait_for_page_ready(self, timeout=None):
+        """Wait for document.readyState to be 'complete'"""
+        return self.wait_until(
+            'page_ready',
+            lambda d: d.execute_script("return document.readyState") == 'complete',
+            timeout,
         )
     
+    def wait_for_relayout(self):
+        """Wait two animation frames, e.g. after set_window_size: by the second frame the
+        browser has applied the new viewport's style, layout and paint"""
+        with self.profile.measure('relayout'):
+            return self.driver.execute_async_script(
+                "const done = arguments[arguments.length - 1];"
+                "requestAnimationFrame(() => requestAnimationFrame(() => done(window.innerWidth)));"
+            )
+    
+    def wait_for_network_idle(self, timeout=None):
+        """Wait until the page is loaded and no fetch() call from the app is in flight"""
+        return self.wait_until(
+            'network_idle',
+            lambda d: d.execute_script(NETWORK_IDLE_JS, NETWORK_QUIET_MS, LOADING_SELECTOR),
+            timeout,
+        )
+    
+    def wait_for_url_change(self, old_url, timeout=None):
+        """Wait for the URL to change (e.g. the redirect after login or logout); False on timeout"""
+        try:
+            self.wait_until('url_change', EC.url_changes(old_url), timeout)
+        except TimeoutException:
+            return False
+        self.wait_for_network_idle(timeout)
+        return True
+    
+    def wait_for_alert(self, timeout=None):
+        """Return the open alert/confirm dialog, or None if none appears within timeout"""
+        if timeout is None:
+            timeout = self.config.SHORT_WAIT
+        try:
+            return self.wait_until('alert', EC.alert_is_present(), timeout)
+        except TimeoutException:
+            return None
+    
+    @contextmanager
+    def expect_dom_change(self, css_selector, timeout=None):
+        """Run the with-block, then wait for a DOM mutation under css_selector and for the
+        app's API calls to settle. Yields a dict whose 'changed' flag is set afterwards."""
+        if timeout is None:
+            timeout = self.config.SHORT_WAIT
+        self.driver.execute_script(DOM_WATCH_JS, css_selector)
+        result = {'changed': False}
+        yield result
+        try:
+            self.wait_until('dom_change', lambda d: d.execute_script("return window.__domChanged === true;"), timeout)
+            result['changed'] = True
+            self.wait_for_network_idle()
+        except TimeoutException:
+            print(f"ℹ️ No change in {css_selector} within {timeout}s")
+    
+    @profiled()
     def safe_click(self, locator):
         """Safely click an element"""
         element = self.wait_for_clickable(locator)
         self.driver.execute_script("arguments[0].scrollIntoView(true);", element)
-        time.sleep(0.5)
         element.click()
     
+    @profiled()
     def safe_send_keys(self, locator, text):
         """Safely send keys to an element"""
         element = self.wait_for_element(locator)
         element.clear()
         element.send_keys(text)
     
-    def is_element_present(self, locator):
-        """Check if element is present"""
+    @profiled()
+    def elements_present(self, locators, visible=False, timeout=None):
+        """Check many locators in one round trip with no implicit wait; one bool per locator.
+
+        With a timeout, poll until at least one locator matches (or the timeout expires)
+        so positive checks can still wait for the page while negative ones return at once.
+        """
+        if not timeout:
+            return query_presence(self.driver, locators, visible)
+        def any_found(driver):
+            found = query_presence(driver, locators, visible)
+            return found if any(found) else False
         try:
-            self.driver.find_element(*locator)
-            return True
-        except:
-            return False
+            return self.wait_until('elements_present', any_found, timeout)
+        except TimeoutException:
+            return [False] * len(locators)
+    
+    def is_element_present(self, locator, visible=False, timeout=None):
+        """Check if element is present (or visible) without paying the implicit wait on a miss"""
+        return self.elements_present([locator], visible, timeout)[0]
+    
+    @profiled()
+    def find_first(self, name, candidates, visible_only=False):
+        """Probe candidate locators in one round trip and return the first non-empty match list.
+
+        The winning candidate is remembered per page under name, so later lookups (and later
+        runs) try it first instead of paying an implicit wait for every miss.
+        """
+        locator, elements = get_registry().find_first(self.driver, name, candidates, visible_only)
+        return elements
     
     def get_element_text(self, locator):
         """Get text from element"""
         element = self.wait_for_element(locator)
         return element.text
     
+    @profiled()
     def take_screenshot(self, name):
-        """Take screenshot with given name"""
-        timestamp = int(time.time())
-        filename = f"screenshots/{name}_{timestamp}.png"
-        self.driver.save_screenshot(filename)
-        print(f"Screenshot saved: {filename}")
-        return filename
+        """Take screenshot with given name (written in the background, see screenshot_service)"""
+        # self.screenshots is filled at teardown with the files that were really written
+        return get_screenshot_service().capture(self.driver, name)
     
     def check_api_health(self):
         """Check if API is healthy"""
         try:
-            response = requests.get(f"{self.config.BASE_URL}/health", timeout=10)
-            return response.status_code == 200 and response.json().get('status') == 'healthy'
+            response = get_session().get(f"{self.config.BASE_URL}/health", timeout=10)
+            return response.status_code == 200 and response.json().get('status') == 'OK'
         except:
             return False
\ No newline at end of file
@@ -0,0 +1,49 @@
+# DevTools Browser Contexts
+# Gives each test an isolated browser context (own cookies, localStorage and cache) inside
+# a long-lived Chromium browser instead of a browser of its own. Workers can also attach
+# to one shared browser through its remote debugging address.
+from selenium.common.exceptions import WebDriverException
+
+
+class BrowserContext:
+    """An isolated context opened for one test, and the window it was opened from"""
+
+    def __init__(self, context_id, handle, home_handle):
+        self.context_id = context_id
+        self.handle = handle
+        self.home_handle = home_handle
+
+
+def supports_contexts(driver):
+    return hasattr(driver, 'execute_cdp_cmd')
+
+
+def open_home_window(driver):
+    """Give an attached session a tab of its own to return to between tests.
+
+    On a shared browser the existing tabs belong to other workers.
+    """
+    target = driver.execute_cdp_cmd('Target.createTarget', {'url': 'about:blank'})
+    driver.switch_to.window(target['targetId'])
+    return target['targetId']
+
+
+def open_context(driver):
+    """Create a fresh browser context with one blank page and switch the session to it"""
+    home_handle = driver.current_window_handle
+    context_id = driver.execute_cdp_cmd('Target.createBrowserContext', {'disposeOnDetach': False})['browserContextId']
+    target = driver.execute_cdp_cmd('Target.createTarget', {'url': 'about:blank', 'browserContextId': context_id})
+    # ChromeDriver window handles are DevTools target ids
+    driver.switch_to.window(target['targetId'])
+    return BrowserContext(context_id, target['targetId'], home_handle)
+
+
+def close_context(driver, context):
+    """Dispose of the context (closing its pages and dropping its storage) and go back home"""
+    try:
+        driver.switch_to.window(context.home_handle)
+    except WebDriverException:
+        # Home tab is gone: keep the test's page as the session's window instead
+        return False
+    driver.execute_cdp_cmd('Target.disposeBrowserContext', {'browserContextId': context.context_id})
+    return True
@@ -0,0 +1,75 @@
+# Browser Memory Accounting
+# Measures the resident memory (RSS) of each browser the suite starts: the driver service
+# process and everything below it (browser, GPU, renderer processes). Linux /proc only.
+import os
+from result_stream import read_stream
+
+
+def _read_process_table():
+    """{pid: (ppid, rss_kb)} for every process visible in /proc"""
+    table = {}
+    for entry in os.listdir('/proc'):
+        if not entry.isdigit():
+            continue
+        try:
+            with open(f'/proc/{entry}/status') as f:
+                fields = dict(line.split(':', 1) for line in f if ':' in line)
+        except OSError:
+            continue  # process exited while we were looking
+        rss = fields.get('VmRSS', '0 kB').split()[0]
+        table[int(entry)] = (int(fields.get('PPid', '0')), int(rss))
+    return table
+
+
+def process_tree_rss_mb(root_pid):
+    """RSS of root_pid and all of its descendants in MB, or None when /proc is unavailable"""
+    if not os.path.isdir('/proc'):
+        return None
+    table = _read_process_table()
+    children = {}
+    for pid, (ppid, _) in table.items():
+        children.setdefault(ppid, []).append(pid)
+    total_kb, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total_kb += table.get(pid, (0, 0))[1]
+        stack.extend(children.get(pid, []))
+    return round(total_kb / 1024, 1)
+
+
+def browser_rss_mb(driver):
+    """Memory held by this WebDriver's browser, measured from its driver service process"""
+    process = getattr(getattr(driver, 'service', None), 'process', None)
+    if process is None:
+        return None
+    return process_tree_rss_mb(process.pid)
+
+
+def available_memory_mb():
+    """MemAvailable from /proc/meminfo, or None"""
+    try:
+        with open('/proc/meminfo') as f:
+            for line in f:
+                if line.startswith('MemAvailable:'):
+                    return int(line.split()[1]) // 1024
+    except OSError:
+        pass
+    return None
+
+
+def print_memory_summary(stream_path):
+    """Peak and mean browser RSS per browser for a run, and how many workers would fit"""
+    samples = {}
+    for record in read_stream(stream_path):
+        if record.get('event') == 'test' and record.get('browser_rss_mb'):
+            samples.setdefault(record.get('browser') or '?', []).append(record['browser_rss_mb'])
+    if not samples:
+        return
+    available = available_memory_mb()
+    for browser, values in sorted(samples.items()):
+        peak = max(values)
+        line = (f"🧠 {browser} RSS: peak {peak:.0f} MB, mean {sum(values) / len(values):.0f} MB "
+                f"over {len(values)} tests")
+        if available:
+            line += f" - about {int(available // peak)} such browsers fit in the {available} MB available"
+        print(line)
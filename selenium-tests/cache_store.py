@@ -0,0 +1,28 @@
+# Persistent JSON Cache Files
+# Small helpers shared by the suite's on-disk caches (driver paths, locators, ...).
+import json
+import os
+import tempfile
+from config import TestConfig
+
+
+def cache_path(name):
+    return os.path.join(TestConfig.CACHE_DIR, name)
+
+
+def load_json(name, default=None):
+    """Load a cache file from CACHE_DIR, returning default if it is missing or corrupt"""
+    try:
+        with open(cache_path(name)) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {} if default is None else default
+
+
+def save_json(name, data):
+    """Write a cache file atomically so parallel workers never see a half-written file"""
+    os.makedirs(TestConfig.CACHE_DIR, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=TestConfig.CACHE_DIR, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_path, cache_path(name))
@@ -7,8 +7,14 @@ load_dotenv()
 class TestConfig:
     # Application URLs
     BASE_URL = os.getenv('BASE_URL', 'http://localhost')
+    BACKEND = os.getenv('BACKEND', 'real')  # real stack at BASE_URL, or 'fake' for the in-process stand-in
     PRODUCTION_URL = os.getenv('PRODUCTION_URL', 'http://4.144.249.110')
     API_BASE_URL = f"{BASE_URL}/api"
+    API_POOL_SIZE = int(os.getenv('API_POOL_SIZE', '16'))  # keep-alive connections per worker
+    READY_TIMEOUT = int(os.getenv('READY_TIMEOUT', '120'))  # seconds to wait for /health and the API before a run
+    HTTP_REPLAY = os.getenv('HTTP_REPLAY', 'off')  # off, record, replay (see http_replay.py)
+    RECORDINGS_FILE = os.getenv('RECORDINGS_FILE', os.path.join('recordings', 'http_recordings.json'))
+    READY_MAX_BACKOFF = int(os.getenv('READY_MAX_BACKOFF', '8'))  # cap on the delay between readiness polls
     
     # Test Credentials
     ADMIN_USERNAME = os.getenv('ADMIN_USERNAME', 'admin')
@@ -17,12 +23,46 @@ class TestConfig:
     TEST_USER_USERNAME = os.getenv('TEST_USER_USERNAME', 'testuser')
     TEST_USER_PASSWORD = os.getenv('TEST_USER_PASSWORD', 'test123')
     TEST_USER_EMAIL = os.getenv('TEST_USER_EMAIL', 'test@example.com')
+    AUTH_TOKEN_CACHE = os.getenv('AUTH_TOKEN_CACHE', 'true').lower() == 'true'  # reuse API login tokens across runs
     
     # Browser Configuration
     BROWSER = os.getenv('BROWSER', 'chrome')  # chrome, firefox, edge
     HEADLESS = os.getenv('HEADLESS', 'false').lower() == 'true'
     IMPLICIT_WAIT = int(os.getenv('IMPLICIT_WAIT', '10'))
     PAGE_LOAD_TIMEOUT = int(os.getenv('PAGE_LOAD_TIMEOUT', '30'))
+    BROWSER_PROFILE = os.getenv('BROWSER_PROFILE', 'full')  # full, or lean (always headless) for high-density runners
+    LEAN_WINDOW_SIZE = os.getenv('LEAN_WINDOW_SIZE', '1280,800')  # fixed viewport instead of maximizing
+    RENDERER_PROCESS_LIMIT = int(os.getenv('RENDERER_PROCESS_LIMIT', '2'))
+    BROWSER_DISK_CACHE = os.getenv('BROWSER_DISK_CACHE', os.path.join('.selenium-cache', 'browser-cache'))  # shared by all lean browsers
+    NETWORK_CAPTURE = os.getenv('NETWORK_CAPTURE', 'false').lower() == 'true'  # Chromium performance log per test
+    
+    # Driver Resolution (cached on disk, keyed by browser and version)
+    DRIVER_OFFLINE = os.getenv('DRIVER_OFFLINE', 'false').lower() == 'true'  # never call webdriver-manager
+    DRIVER_PATH = os.getenv('DRIVER_PATH', '')  # explicit driver binary, skips resolution entirely
+    BROWSER_VERSION = os.getenv('BROWSER_VERSION', '')  # overrides the detected browser version
+    
+    # Driver Pool (one pool per worker process)
+    REUSE_DRIVERS = os.getenv('REUSE_DRIVERS', 'true').lower() == 'true'
+    DRIVER_MAX_USES = int(os.getenv('DRIVER_MAX_USES', '25'))  # recycle a browser after this many tests
+    DRIVER_POOL_SIZE = int(os.getenv('DRIVER_POOL_SIZE', '1'))  # idle browsers kept warm per worker
+    BROWSER_CONTEXTS = os.getenv('BROWSER_CONTEXTS', 'false').lower() == 'true'  # Chromium: one isolated context per test
+    SHARED_BROWSER_ADDRESS = os.getenv('SHARED_BROWSER_ADDRESS', '')  # host:port of a browser every worker attaches to
+    REMOTE_DEBUGGING_PORT = int(os.getenv('REMOTE_DEBUGGING_PORT', '0'))  # expose a launched browser for attaching
+    
+    # Output Locations
+    SCREENSHOT_DIR = os.getenv('SCREENSHOT_DIR', 'screenshots')
+    SCREENSHOT_MODE = os.getenv('SCREENSHOT_MODE', 'always')  # always, on-failure, off
+    SCREENSHOT_WORKERS = int(os.getenv('SCREENSHOT_WORKERS', '1'))  # background encode/write threads
+    SCREENSHOT_DEDUP_DISTANCE = int(os.getenv('SCREENSHOT_DEDUP_DISTANCE', '0'))  # max dHash bit difference to skip
+    SCREENSHOT_MAX_WIDTH = int(os.getenv('SCREENSHOT_MAX_WIDTH', '1280'))
+    SCREENSHOT_MAX_FILES = int(os.getenv('SCREENSHOT_MAX_FILES', '500'))
+    SCREENSHOT_MAX_MB = int(os.getenv('SCREENSHOT_MAX_MB', '200'))
+    CACHE_DIR = os.getenv('CACHE_DIR', '.selenium-cache')
+    AFFECTED_ONLY = os.getenv('AFFECTED_ONLY', 'false').lower() == 'true'  # run only tests whose files changed
+    RERUN_FAILED = os.getenv('RERUN_FAILED', 'off')  # off, first or only: previously failing tests (see result_cache.py)
+    RERUN_FAILED_FOUND = os.getenv('RERUN_FAILED_FOUND', '')  # 'true'/'false', set once per run_tests.py invocation
+    DURATION_SCHEDULING = os.getenv('DURATION_SCHEDULING', 'true').lower() == 'true'  # longest-first order
+    DURATIONS_FILE = os.getenv('DURATIONS_FILE', '')  # shared history that --shard balances by; name split without it
     
     # Test Data
     TEST_INVENTORY_ITEM = {
@@ -34,7 +74,16 @@ class TestConfig:
         'sku': 'TEST-LAPTOP-001'
     }
     
+    # Seeded Data (see data_fixtures.py)
+    SEED_ITEM_COUNT = int(os.getenv('SEED_ITEM_COUNT', '0'))  # overrides each class's SEED_ITEMS when > 0
+    SEED_CONCURRENCY = int(os.getenv('SEED_CONCURRENCY', '16'))
+    
     # Timeouts
     SHORT_WAIT = 5
     MEDIUM_WAIT = 10
-    LONG_WAIT = 20
\ No newline at end of file
+    LONG_WAIT = 20
+
+
+def get_worker_id():
+    """Return the pytest-xdist worker id ('gw0', 'gw1', ...) or 'main' for serial runs"""
+    return os.getenv('PYTEST_XDIST_WORKER', 'main')
@@ -0,0 +1,199 @@
+# Shared pytest hooks for the Selenium suite
+import pytest
+from config import TestConfig, get_worker_id
+from data_fixtures import InventorySeeder
+from duration_history import DurationHistory, DurationRecorder, balance_shards, longest_first
+from impact_map import ImpactMap, ImpactRecorder, tracker
+from driver_pool import shutdown_pool
+from http_replay import discard_worker_recordings, replay_mode, shutdown_store
+from result_cache import ResultCache, ResultRecorder, order_failed_first
+from result_stream import ResultStream
+from screenshot_service import shutdown_screenshot_service
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("selenium-runner")
+    group.addoption(
+        "--shard",
+        action="store",
+        default=None,
+        help="Run only shard i of k (format: i/k, 1-based), splitting by test class",
+    )
+    group.addoption(
+        "--results-stream",
+        action="store",
+        default=None,
+        help="Append one JSON line per finished test to this file while the run is in progress",
+    )
+    group.addoption(
+        "--durations-file",
+        action="store",
+        default=TestConfig.DURATIONS_FILE or None,
+        help="Duration history every shard reads to balance --shard by predicted time "
+             "(default: DURATIONS_FILE; without it shards split by class name)",
+    )
+    group.addoption(
+        "--affected-only",
+        action="store_true",
+        default=False,
+        help="Run only tests whose pages, assets, API or test code changed since they last passed",
+    )
+    group.addoption(
+        "--full",
+        action="store_true",
+        default=False,
+        help="Run every collected test, overriding --affected-only and AFFECTED_ONLY",
+    )
+
+
+def pytest_configure(config):
+    stream_path = config.getoption("--results-stream")
+    # Under xdist only the controller writes: worker reports are forwarded to it
+    if stream_path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ResultStream(stream_path), "result-stream")
+    if not hasattr(config, "workerinput"):
+        if replay_mode() == "record":
+            # Workers write part files that the controller merges at the end
+            discard_worker_recordings()
+        config.pluginmanager.register(ImpactRecorder(ImpactMap()), "impact-recorder")
+        config.pluginmanager.register(ResultRecorder(ResultCache()), "result-recorder")
+    if TestConfig.DURATION_SCHEDULING and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(DurationRecorder(DurationHistory()), "duration-recorder")
+
+
+def parse_shard(value):
+    """Parse an 'i/k' shard spec into a (index, total) tuple with a 0-based index"""
+    try:
+        index, total = (int(part) for part in value.split("/"))
+    except ValueError:
+        raise pytest.UsageError(f"Invalid --shard value '{value}', expected i/k (e.g. 1/4)")
+    if total < 1 or not 1 <= index <= total:
+        raise pytest.UsageError(f"Invalid --shard value '{value}', need 1 <= i <= k")
+    return index - 1, total
+
+
+def group_key(item):
+    """Scheduling unit for an item: its test class, or its module for plain functions"""
+    return item.nodeid.rsplit("::", 1)[0]
+
+
+def select_affected(config, items):
+    """Deselect tests whose recorded files are all unchanged since they last passed"""
+    impact_map = ImpactMap()
+    affected, unaffected, changed = [], [], set()
+    for item in items:
+        item_changed = impact_map.changed_files(item.nodeid)
+        if item_changed == []:
+            unaffected.append(item)
+        else:
+            affected.append(item)
+            changed.update(item_changed or [])
+    if unaffected:
+        config.hook.pytest_deselected(items=unaffected)
+    items[:] = affected
+    print(f"\n🎯 Test impact: {len(affected)} affected, {len(unaffected)} unchanged tests skipped")
+    if changed:
+        print(f"   Changed: {', '.join(sorted(changed))}")
+
+
+def pytest_collection_modifyitems(config, items):
+    if (config.getoption("--affected-only") or TestConfig.AFFECTED_ONLY) and not config.getoption("--full"):
+        select_affected(config, items)
+    schedule(config, items)
+    # Last, so previously failing tests stay in front of the duration order
+    deselected = order_failed_first(items, TestConfig.RERUN_FAILED)
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    if TestConfig.RERUN_FAILED != "off":
+        print(f"\n🔁 Rerun failed ({TestConfig.RERUN_FAILED}): {len(items)} tests selected, {len(deselected)} deselected")
+
+
+def schedule(config, items):
+    """Order test classes by predicted duration and keep only this run's shard"""
+    shard = config.getoption("--shard")
+    if TestConfig.DURATION_SCHEDULING:
+        # Predicted time per class from past runs: longest classes start first so the last
+        # worker to finish is not stuck with a long class
+        estimates = DurationHistory().group_estimates([item.nodeid for item in items])
+        rank = {group: position for position, group in enumerate(longest_first(estimates))}
+        items.sort(key=lambda item: rank[group_key(item)])  # stable: keeps order within a class
+    if not shard:
+        return
+    index, total = parse_shard(shard)
+    durations_file = config.getoption("--durations-file")
+    if durations_file:
+        # Every shard must read the same history, or machines disagree on the split and
+        # classes run twice or never; a local CACHE_DIR history is not enough for that
+        try:
+            history = DurationHistory(durations_file)
+        except (OSError, ValueError) as e:
+            raise pytest.UsageError(f"--durations-file {durations_file}: {e}")
+        estimates = history.group_estimates([item.nodeid for item in items])
+        selected_groups = balance_shards(estimates, total)[index]
+    else:
+        groups = sorted({group_key(item) for item in items})
+        selected_groups = {group for position, group in enumerate(groups) if position % total == index}
+
+    selected = [item for item in items if group_key(item) in selected_groups]
+    deselected = [item for item in items if group_key(item) not in selected_groups]
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+    items[:] = selected
+
+
+@pytest.fixture(scope="class")
+def seeded_inventory(request):
+    """Seed SEED_ITEMS items over the API before a test class and delete them afterwards.
+
+    Items added through the UI form (TEST_INVENTORY_ITEM) are purged as well so they
+    do not pile up across runs.
+    """
+    count = TestConfig.SEED_ITEM_COUNT or getattr(request.cls, "SEED_ITEMS", 0)
+    seeder = InventorySeeder()
+    try:
+        seeder.seed(count)
+    except Exception:
+        # No teardown runs when the fixture fails: remove what was created before raising
+        seeder.cleanup()
+        raise
+    if request.cls is not None:
+        request.cls.seeded_items = seeder.items
+    yield seeder
+    seeder.cleanup()
+    seeder.purge_by_name(TestConfig.TEST_INVENTORY_ITEM['name'])
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item):
+    # Before fixtures run, so API calls made while seeding count for the test too
+    tracker.start_test()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    outcome = yield
+    report = outcome.get_result()
+    # Lets BaseTest.teardown_method know whether the test body failed
+    if report.when == "call" and item.instance is not None:
+        item.instance.test_failed = report.failed
+    
+    # Ship BaseTest's timings, helper profile and screenshots with the final report (serialized by xdist)
+    if report.when == "teardown":
+        instance = item.instance
+        report.user_properties = list(report.user_properties) + [
+            ("phase_timings", dict(getattr(instance, "phase_timings", {}))),
+            ("screenshots", list(getattr(instance, "screenshots", []))),
+            ("profile", instance.profile.as_dict() if hasattr(instance, "profile") else None),
+            ("network", getattr(instance, "network", None)),
+            ("browser_rss_mb", getattr(instance, "browser_rss_mb", None)),
+            ("touched", tracker.finish_test()),
+            ("worker", get_worker_id()),
+            ("browser", TestConfig.BROWSER if hasattr(instance, "driver") else None),
+        ]
+
+
+def pytest_sessionfinish(session, exitstatus):
+    # Each xdist worker runs its own session, so this quits that worker's browsers
+    shutdown_pool()
+    shutdown_screenshot_service()
+    shutdown_store()
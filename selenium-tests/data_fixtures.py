@@ -0,0 +1,83 @@
+# Test Data Seeding and Teardown
+# Creates inventory items concurrently through POST /api/inventory, remembers their ids
+# and deletes them in parallel afterwards, so UI tests never depend on leftover data.
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from api_auth import get_auth_session
+from api_client import ApiClient
+from config import TestConfig
+from http_replay import replay_mode
+
+CATEGORIES = ['Electronics', 'Clothing', 'Books', 'Home & Garden', 'Sports', 'Other']
+
+
+class InventorySeeder:
+    """Seed and clean up a tagged batch of inventory items"""
+
+    def __init__(self, concurrency=None):
+        self.api = ApiClient(token=get_auth_session()['token'])
+        self.concurrency = concurrency or TestConfig.SEED_CONCURRENCY
+        # Recorded runs need identical request bodies every time so replay can match them
+        self.tag = 'replay' if replay_mode() != 'off' else uuid.uuid4().hex[:6]
+        self.items = []
+
+    def build_item(self, index):
+        return {
+            'name': f"Seed {self.tag} #{index:05d}",
+            'description': f"Seeded test item {index} (batch {self.tag})",
+            'quantity': index % 100,
+            'price': round(1 + (index % 500) * 1.25, 2),
+            'category': CATEGORIES[index % len(CATEGORIES)],
+        }
+
+    def _create(self, index):
+        response = self.api.create_item(self.build_item(index))
+        if response.status_code != 201:
+            raise AssertionError(f"Seeding item {index} failed: {response.status_code} {response.text}")
+        return response.json()
+
+    def _delete(self, item_id):
+        # 404 is fine: the test itself may have deleted the item
+        return self.api.delete_item(item_id).status_code in (200, 404)
+
+    def seed(self, count):
+        """Create count items in parallel; returns the created item documents.
+
+        If any create fails, the items that were created are still tracked (so cleanup()
+        removes them) before the first error is raised.
+        """
+        if count <= 0:
+            return []
+        print(f"🌱 Seeding {count} inventory items (batch {self.tag})...")
+        offset = len(self.items)  # repeated calls keep numbering unique within the batch
+        created, errors = [], []
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            futures = [executor.submit(self._create, index) for index in range(offset, offset + count)]
+            for future in futures:
+                try:
+                    created.append(future.result())
+                except Exception as e:
+                    errors.append(e)
+        self.items.extend(created)
+        if errors:
+            print(f"⚠️ {len(errors)}/{count} seed items failed (batch {self.tag})")
+            raise errors[0]
+        return created
+
+    def cleanup(self):
+        """Delete every item this seeder created"""
+        if not self.items:
+            return
+        ids = [item['_id'] for item in self.items]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            results = list(executor.map(self._delete, ids))
+        failed = results.count(False)
+        print(f"🧹 Removed {len(ids) - failed}/{len(ids)} seeded items (batch {self.tag})")
+        self.items = []
+
+    def purge_by_name(self, name):
+        """Delete items with exactly this name, e.g. rows the UI tests added through the form"""
+        matching = [item['_id'] for item in self.api.list_items().json() if item.get('name') == name]
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(self._delete, matching))
+        return len(matching)
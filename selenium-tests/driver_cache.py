@@ -0,0 +1,104 @@
+# Driver Binary Resolution Cache
+# Resolves chromedriver/geckodriver/msedgedriver once and remembers the path on disk,
+# keyed by browser and installed browser version, so webdriver-manager is not hit per test.
+import os
+import shutil
+import time
+from webdriver_manager.chrome import ChromeDriverManager
+from webdriver_manager.firefox import GeckoDriverManager
+from webdriver_manager.microsoft import EdgeChromiumDriverManager
+from webdriver_manager.core.os_manager import OperationSystemManager, ChromeType
+from cache_store import cache_path, load_json, save_json
+from config import TestConfig
+
+CACHE_FILE = 'drivers.json'
+
+DRIVER_MANAGERS = {
+    'chrome': ChromeDriverManager,
+    'firefox': GeckoDriverManager,
+    'edge': EdgeChromiumDriverManager,
+}
+
+DRIVER_EXECUTABLES = {
+    'chrome': 'chromedriver',
+    'firefox': 'geckodriver',
+    'edge': 'msedgedriver',
+}
+
+BROWSER_TYPES = {
+    'chrome': ChromeType.GOOGLE,
+    'firefox': 'firefox',
+    'edge': ChromeType.MSEDGE,
+}
+
+# Per-process memo so repeated lookups in one worker cost nothing
+_resolved = {}
+
+
+class DriverResolutionError(Exception):
+    """Raised when no driver binary can be found for the configured browser"""
+
+
+def installed_browser_version(browser):
+    """Installed browser version from the local OS (never touches the network)"""
+    if TestConfig.BROWSER_VERSION:
+        return TestConfig.BROWSER_VERSION
+    try:
+        version = OperationSystemManager().get_browser_version_from_os(BROWSER_TYPES[browser])
+    except Exception:
+        version = None
+    return version or 'unknown'
+
+
+def resolve_driver_path(browser):
+    """Return the driver binary path for browser, resolving it at most once per version.
+
+    Returns None when Selenium should locate the driver itself (online mode only).
+    """
+    if browser in _resolved:
+        return _resolved[browser]
+
+    started = time.time()
+    version = installed_browser_version(browser)
+    key = f"{browser}:{version}"
+    # Without a version the key cannot tell a browser upgrade apart: never use or keep it
+    cacheable = version != 'unknown'
+    source = 'cache'
+
+    path = TestConfig.DRIVER_PATH or None
+    if path:
+        source = 'DRIVER_PATH'
+    else:
+        entries = load_json(CACHE_FILE)
+        cached = entries.get(key) if cacheable else None
+        if cached and os.path.exists(cached):
+            path = cached
+        elif TestConfig.DRIVER_OFFLINE:
+            path = shutil.which(DRIVER_EXECUTABLES[browser])
+            source = 'PATH'
+        else:
+            try:
+                path = DRIVER_MANAGERS[browser]().install()
+                source = 'webdriver-manager'
+            except Exception as e:
+                print(f"⚠️ WebDriver Manager failed: {e}")
+                path = shutil.which(DRIVER_EXECUTABLES[browser])
+                source = 'PATH'
+            # A PATH fallback is whatever happens to be installed, not a match for this version
+            if path and cacheable and source == 'webdriver-manager':
+                entries[key] = path
+                save_json(CACHE_FILE, entries)
+
+    if not path:
+        if TestConfig.DRIVER_OFFLINE:
+            raise DriverResolutionError(
+                f"No {DRIVER_EXECUTABLES[browser]} found for {key} in offline mode. "
+                f"Set DRIVER_PATH or warm the cache in {cache_path(CACHE_FILE)} while online."
+            )
+        # Last resort: let Selenium Manager locate a driver when the browser starts
+        print(f"⚠️ No cached or PATH {DRIVER_EXECUTABLES[browser]} for {key}, deferring to Selenium")
+        source = 'selenium'
+
+    print(f"🔧 Resolved {DRIVER_EXECUTABLES[browser]} for {key} from {source} in {time.time() - started:.2f}s")
+    _resolved[browser] = path
+    return path
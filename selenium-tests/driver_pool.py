@@ -0,0 +1,128 @@
+# Worker-scoped WebDriver Pool
+# Keeps warm browsers alive between tests instead of launching one per test method.
+# Each pytest(-xdist) worker process owns exactly one pool.
+import threading
+from urllib.parse import urlsplit
+from selenium.common.exceptions import NoAlertPresentException, WebDriverException
+from config import TestConfig
+
+
+class DriverPool:
+    """Lease warm WebDriver sessions to tests and recycle them after use"""
+
+    def __init__(self, max_uses=None, max_idle=None):
+        self.config = TestConfig()
+        self.max_uses = max_uses or self.config.DRIVER_MAX_USES
+        self.max_idle = max_idle or self.config.DRIVER_POOL_SIZE
+        self._idle = []
+        self._uses = {}
+        self._lock = threading.Lock()
+        self.created = 0
+        self.recycled = 0
+
+    def lease(self, factory):
+        """Return a clean idle driver, or create one with factory() if none is available"""
+        while True:
+            with self._lock:
+                driver = self._idle.pop() if self._idle else None
+            if driver is None:
+                break
+            if self._is_alive(driver):
+                self._uses[id(driver)] += 1
+                return driver
+            self._discard(driver)
+
+        driver = factory()
+        with self._lock:
+            self._uses[id(driver)] = 1
+            self.created += 1
+        return driver
+
+    def release(self, driver, broken=False, reset=True):
+        """Give a driver back; it is reset for the next test or quit if it is worn out or crashed.
+
+        reset=False skips the cleanup when the test's state is already gone (e.g. it ran
+        in a browser context that has been disposed).
+        """
+        if broken or self._uses.get(id(driver), 0) >= self.max_uses:
+            self._discard(driver)
+            return
+
+        try:
+            if reset:
+                self.reset(driver)
+        except WebDriverException as e:
+            print(f"⚠️ Browser reset failed, recycling it: {e.msg}")
+            self._discard(driver)
+            return
+
+        with self._lock:
+            if len(self._idle) < self.max_idle:
+                self._idle.append(driver)
+                return
+        self._discard(driver)
+
+    def reset(self, driver):
+        """Return a browser to a blank state: no alerts, extra windows, cookies or web storage"""
+        try:
+            driver.switch_to.alert.dismiss()
+        except NoAlertPresentException:
+            pass
+
+        handles = driver.window_handles
+        for handle in handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(handles[0])
+
+        # Storage can only be cleared from a page on the application origin
+        if self._on_app_origin(driver):
+            driver.execute_script("window.localStorage.clear(); window.sessionStorage.clear();")
+        driver.delete_all_cookies()
+        driver.get("about:blank")
+
+    def shutdown(self):
+        """Quit every idle browser; called once at the end of the worker's session"""
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for driver in idle:
+            self._discard(driver)
+
+    def _on_app_origin(self, driver):
+        current = urlsplit(driver.current_url)
+        base = urlsplit(self.config.BASE_URL)
+        return (current.scheme, current.netloc) == (base.scheme, base.netloc)
+
+    def _is_alive(self, driver):
+        try:
+            driver.current_url
+            return True
+        except WebDriverException:
+            return False
+
+    def _discard(self, driver):
+        self._uses.pop(id(driver), None)
+        self.recycled += 1
+        try:
+            driver.quit()
+        except WebDriverException:
+            pass
+
+
+_pool = None
+
+
+def get_pool():
+    """Return this worker's driver pool, creating it on first use"""
+    global _pool
+    if _pool is None:
+        _pool = DriverPool()
+    return _pool
+
+
+def shutdown_pool():
+    """Quit all pooled browsers for this worker"""
+    global _pool
+    if _pool is not None:
+        _pool.shutdown()
+        _pool = None
@@ -0,0 +1,102 @@
+# Duration History and Scheduling
+# Keeps a smoothed per-test duration history on disk and uses it to order test classes
+# longest first and to split them into shards with balanced predicted run time.
+import json
+import statistics
+from cache_store import load_json, save_json
+
+CACHE_FILE = 'durations.json'
+SMOOTHING = 0.5  # weight of the newest run in the moving average
+DEFAULT_ESTIMATE = 5.0  # seconds, for a test when nothing at all is known yet
+
+
+def scope_of(nodeid):
+    """Test class (or module, for plain functions) a test belongs to"""
+    return nodeid.rsplit('::', 1)[0]
+
+
+def module_of(nodeid):
+    return nodeid.split('::', 1)[0]
+
+
+class DurationHistory:
+    """Per-test durations (setup + call + teardown) smoothed across runs.
+
+    Reads this machine's history from CACHE_DIR, or an explicit file (e.g. a durations.json
+    shared between CI machines) when path is given. Errors reading an explicit file propagate.
+    """
+
+    def __init__(self, path=None):
+        if path:
+            with open(path) as f:
+                self.durations = json.load(f)
+        else:
+            self.durations = load_json(CACHE_FILE)
+
+    def estimate(self, nodeid):
+        """Known duration, else the median of the test's class, module or whole history"""
+        if nodeid in self.durations:
+            return self.durations[nodeid]
+        for same_group in (scope_of, module_of):
+            peers = [d for n, d in self.durations.items() if same_group(n) == same_group(nodeid)]
+            if peers:
+                return statistics.median(peers)
+        if self.durations:
+            return statistics.median(self.durations.values())
+        return DEFAULT_ESTIMATE
+
+    def group_estimates(self, nodeids, group_key=scope_of):
+        """Predicted run time per scheduling group"""
+        totals = {}
+        for nodeid in nodeids:
+            group = group_key(nodeid)
+            totals[group] = totals.get(group, 0.0) + self.estimate(nodeid)
+        return totals
+
+    def record(self, measured):
+        """Fold {nodeid: seconds} from a finished run into the history file"""
+        if not measured:
+            return
+        # Re-read first: another shard or run may have saved since we loaded
+        merged = load_json(CACHE_FILE)
+        for nodeid, seconds in measured.items():
+            previous = merged.get(nodeid)
+            merged[nodeid] = round(seconds if previous is None
+                                   else SMOOTHING * seconds + (1 - SMOOTHING) * previous, 3)
+        save_json(CACHE_FILE, merged)
+        self.durations = merged
+
+
+def longest_first(group_estimates):
+    """Groups ordered by predicted time, longest first (ties by name for stable runs)"""
+    return sorted(group_estimates, key=lambda group: (-group_estimates[group], group))
+
+
+def balance_shards(group_estimates, total):
+    """Greedy longest-processing-time split of groups into total shards; returns a list of sets"""
+    shards = [set() for _ in range(total)]
+    loads = [0.0] * total
+    for group in longest_first(group_estimates):
+        lightest = min(range(total), key=lambda index: (loads[index], index))
+        shards[lightest].add(group)
+        loads[lightest] += group_estimates[group]
+    return shards
+
+
+class DurationRecorder:
+    """pytest plugin (controller only) that measures each test and updates the history"""
+
+    def __init__(self, history):
+        self.history = history
+        self.measured = {}
+        self.skipped = set()
+
+    def pytest_runtest_logreport(self, report):
+        self.measured[report.nodeid] = self.measured.get(report.nodeid, 0.0) + report.duration
+        if report.skipped:
+            self.skipped.add(report.nodeid)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        # Skipped tests say nothing about how long the test really takes
+        self.history.record({nodeid: seconds for nodeid, seconds in self.measured.items()
+                             if nodeid not in self.skipped})
@@ -0,0 +1,387 @@
+#!/usr/bin/env python3
+"""
+In-Process Stand-In Backend for Inventory Management System
+Implements the /health, /api/auth/* and /api/inventory contract of server.js on top of
+in-memory storage and serves public/ the way frontend/nginx.conf does, so the browser
+suite can run hermetically without Node, MongoDB or nginx
+"""
+
+import argparse
+import base64
+import hashlib
+import hmac
+import json
+import mimetypes
+import os
+import re
+import sys
+import threading
+import time
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import urlsplit
+from config import TestConfig
+
+PUBLIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "public")
+JWT_SECRET = os.getenv("JWT_SECRET", "your-secret-key-change-in-production")
+TOKEN_LIFETIME = 24 * 3600
+ITEM_FIELDS = ("name", "description", "quantity", "price", "category")
+OBJECT_ID = re.compile(r"[0-9a-f]{24}")
+
+
+def now_iso():
+    return datetime.now(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+
+def new_object_id():
+    """24 hex characters, like a MongoDB ObjectId (timestamp prefix keeps them sortable)"""
+    return f"{int(time.time()):08x}{os.urandom(8).hex()}"
+
+
+def b64url(data):
+    return base64.urlsafe_b64encode(data).rstrip(b"=").decode()
+
+
+def sign_jwt(payload):
+    """HS256 JWT compatible with the tokens jsonwebtoken issues in server.js"""
+    header = b64url(json.dumps({"alg": "HS256", "typ": "JWT"}).encode())
+    body = b64url(json.dumps(payload).encode())
+    signature = hmac.new(JWT_SECRET.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
+    return f"{header}.{body}.{b64url(signature)}"
+
+
+def verify_jwt(token):
+    """Return the payload of a valid, unexpired token, else None"""
+    try:
+        header, body, signature = token.split(".")
+        expected = hmac.new(JWT_SECRET.encode(), f"{header}.{body}".encode(), hashlib.sha256).digest()
+        if not hmac.compare_digest(b64url(expected), signature):
+            return None
+        payload = json.loads(base64.urlsafe_b64decode(body + "=" * (-len(body) % 4)))
+    except ValueError:
+        return None
+    return payload if payload.get("exp", 0) > time.time() else None
+
+
+class ValidationError(Exception):
+    """Mirrors a Mongoose validation/cast error (answered with 400)"""
+
+
+class FakeStore:
+    """Thread-safe in-memory users and inventory items"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.users = {}
+        self.items = {}
+
+    @staticmethod
+    def hash_password(password):
+        return hashlib.sha256(password.encode()).hexdigest()
+
+    def add_user(self, username, email, password):
+        user = {"_id": new_object_id(), "username": username, "email": email,
+                "password": self.hash_password(password), "createdAt": now_iso(), "__v": 0}
+        self.users[user["_id"]] = user
+        return user
+
+    def find_user(self, username=None, email=None):
+        for user in self.users.values():
+            if (username and user["username"] == username) or (email and user["email"] == email):
+                return user
+        return None
+
+    @staticmethod
+    def clean_item(fields, partial=False):
+        """Apply the inventorySchema rules: required fields, numeric casts and min 0.
+
+        Updates are partial: like findByIdAndUpdate, fields left out are not touched.
+        """
+        item = {}
+        for field in ITEM_FIELDS:
+            value = fields.get(field)
+            if partial and value is None:
+                continue
+            if value is None or value == "":
+                raise ValidationError(f"InventoryItem validation failed: {field}: Path `{field}` is required.")
+            if field in ("quantity", "price"):
+                try:
+                    value = float(value)
+                except (TypeError, ValueError):
+                    raise ValidationError(f"InventoryItem validation failed: {field}: Cast to Number failed")
+                if value < 0:
+                    raise ValidationError(f"InventoryItem validation failed: {field}: must be at least 0")
+                value = int(value) if value.is_integer() else value
+            else:
+                value = str(value)
+            item[field] = value
+        return item
+
+    def create_item(self, fields):
+        item = self.clean_item(fields)
+        timestamp = now_iso()
+        item.update({"_id": new_object_id(), "createdAt": timestamp, "updatedAt": timestamp, "__v": 0})
+        with self.lock:
+            self.items[item["_id"]] = item
+        return item
+
+
+class FakeBackendHandler(BaseHTTPRequestHandler):
+    """Routes requests to the same status codes and JSON bodies server.js produces"""
+
+    server_version = "FakeInventoryBackend/1.0"
+    protocol_version = "HTTP/1.1"
+    # Headers and body go out as separate writes; with Nagle on, every keep-alive
+    # response after the first would wait ~40 ms for the client's delayed ACK
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass  # keep test output readable
+
+    @property
+    def store(self):
+        return self.server.store
+
+    def send_json(self, status, body):
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(payload)))
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def read_json(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        if not length:
+            return {}
+        try:
+            body = json.loads(self.rfile.read(length))
+        except ValueError:
+            return None
+        return body if isinstance(body, dict) else {}
+
+    def authenticated_user(self):
+        header = self.headers.get("Authorization") or ""
+        token = header.split(" ")[1] if " " in header else ""
+        if not token:
+            self.send_json(401, {"error": "Access token required"})
+            return None
+        payload = verify_jwt(token)
+        if payload is None:
+            self.send_json(403, {"error": "Invalid token"})
+        return payload
+
+    def issue_token(self, user):
+        issued = int(time.time())
+        return sign_jwt({"userId": user["_id"], "username": user["username"],
+                         "iat": issued, "exp": issued + TOKEN_LIFETIME})
+
+    def public_user(self, user):
+        return {"id": user["_id"], "username": user["username"], "email": user["email"]}
+
+    # Dispatch
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Methods", "GET,HEAD,PUT,PATCH,POST,DELETE")
+        self.send_header("Access-Control-Allow-Headers", "Content-Type, Authorization")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_GET(self):
+        self.route("GET")
+
+    def do_POST(self):
+        self.route("POST")
+
+    def do_PUT(self):
+        self.route("PUT")
+
+    def do_DELETE(self):
+        self.route("DELETE")
+
+    def route(self, method):
+        # Always consume the body so the keep-alive connection stays in sync on early returns
+        self.body = self.read_json()
+        path = urlsplit(self.path).path
+        parts = [part for part in path.split("/") if part]
+        if path == "/health" and method == "GET":
+            return self.send_json(200, {"status": "OK", "timestamp": now_iso()})
+        if parts[:2] == ["api", "auth"] and len(parts) == 3:
+            handler = getattr(self, f"auth_{parts[2]}", None)
+            if handler and (method, parts[2]) in {("POST", "register"), ("POST", "login"),
+                                                  ("POST", "logout"), ("GET", "me")}:
+                return handler()
+        if parts[:2] == ["api", "inventory"] and len(parts) <= 3:
+            item_id = parts[2] if len(parts) == 3 else None
+            handler = getattr(self, f"inventory_{method.lower()}", None)
+            if handler and (item_id is not None or method in ("GET", "POST")):
+                if item_id is not None and not OBJECT_ID.fullmatch(item_id):
+                    # Mongoose CastError: 400 from the update route, 500 from the others
+                    return self.send_json(400 if method == "PUT" else 500,
+                                          {"error": f'Cast to ObjectId failed for value "{item_id}"'})
+                return handler(item_id)
+        if parts[:1] == ["api"] or method != "GET":
+            return self.send_json(404, {"error": f"Cannot {method} {path}"})
+        return self.serve_static(path)
+
+    # Authentication
+
+    def auth_register(self):
+        body = self.body
+        if body is None:
+            return self.send_json(400, {"error": "Invalid JSON"})
+        username, email, password = body.get("username"), body.get("email"), body.get("password")
+        if not username or not email or not password:
+            return self.send_json(400, {"error": "All fields are required"})
+        if len(password) < 6:
+            return self.send_json(400, {"error": "Password must be at least 6 characters long"})
+        with self.store.lock:
+            if self.store.find_user(username, email):
+                return self.send_json(400, {"error": "Username or email already exists"})
+            user = self.store.add_user(username, email, password)
+        self.send_json(201, {"message": "User registered successfully", "token": self.issue_token(user),
+                             "user": self.public_user(user)})
+
+    def auth_login(self):
+        body = self.body
+        if body is None:
+            return self.send_json(400, {"error": "Invalid JSON"})
+        username, password = body.get("username"), body.get("password")
+        if not username or not password:
+            return self.send_json(400, {"error": "Username and password are required"})
+        with self.store.lock:
+            user = self.store.find_user(username=username)
+        if not user or user["password"] != self.store.hash_password(password):
+            return self.send_json(401, {"error": "Invalid credentials"})
+        self.send_json(200, {"message": "Login successful", "token": self.issue_token(user),
+                             "user": self.public_user(user)})
+
+    def auth_logout(self):
+        if self.authenticated_user():
+            self.send_json(200, {"message": "Logout successful"})
+
+    def auth_me(self):
+        payload = self.authenticated_user()
+        if payload:
+            user = self.store.users.get(payload.get("userId"))
+            self.send_json(200, {k: v for k, v in user.items() if k != "password"} if user else None)
+
+    # Inventory (unauthenticated, like server.js)
+
+    def inventory_get(self, item_id):
+        with self.store.lock:
+            if item_id is None:
+                items = sorted(self.store.items.values(), key=lambda item: item["createdAt"], reverse=True)
+                return self.send_json(200, items)
+            item = self.store.items.get(item_id)
+        if item is None:
+            return self.send_json(404, {"error": "Item not found"})
+        self.send_json(200, item)
+
+    def inventory_post(self, item_id):
+        if item_id is not None:
+            return self.send_json(404, {"error": f"Cannot POST {self.path}"})
+        try:
+            item = self.store.create_item(self.body or {})
+        except ValidationError as e:
+            return self.send_json(400, {"error": str(e)})
+        self.send_json(201, item)
+
+    def inventory_put(self, item_id):
+        try:
+            fields = self.store.clean_item(self.body or {}, partial=True)
+        except ValidationError as e:
+            return self.send_json(400, {"error": str(e)})
+        with self.store.lock:
+            item = self.store.items.get(item_id)
+            if item is None:
+                return self.send_json(404, {"error": "Item not found"})
+            item.update(fields, updatedAt=now_iso())
+        self.send_json(200, item)
+
+    def inventory_delete(self, item_id):
+        with self.store.lock:
+            item = self.store.items.pop(item_id, None)
+        if item is None:
+            return self.send_json(404, {"error": "Item not found"})
+        self.send_json(200, {"message": "Item deleted successfully", "item": item})
+
+    # Static files (frontend/nginx.conf: index login.html, SPA fallback to index.html)
+
+    def serve_static(self, path):
+        root = os.path.realpath(PUBLIC_DIR)
+        target = os.path.realpath(os.path.join(root, path.lstrip("/")))
+        if not target.startswith(root):
+            return self.send_json(404, {"error": "Not found"})
+        if os.path.isdir(target):
+            target = os.path.join(target, "login.html")
+        if not os.path.isfile(target):
+            target = os.path.join(root, "index.html")
+        with open(target, "rb") as f:
+            payload = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", mimetypes.guess_type(target)[0] or "application/octet-stream")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+class FakeBackend:
+    """Runs the stand-in backend on a background thread"""
+
+    def __init__(self, host="127.0.0.1", port=0):
+        self.store = FakeStore()
+        # The suite's configured accounts exist from the start, as on a provisioned stack
+        self.store.add_user(TestConfig.ADMIN_USERNAME, "admin@example.com", TestConfig.ADMIN_PASSWORD)
+        self.store.add_user(TestConfig.TEST_USER_USERNAME, TestConfig.TEST_USER_EMAIL, TestConfig.TEST_USER_PASSWORD)
+        self.server = ThreadingHTTPServer((host, port), FakeBackendHandler)
+        self.server.daemon_threads = True
+        self.server.store = self.store
+        self.thread = None
+
+    @property
+    def base_url(self):
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self):
+        self.thread = threading.Thread(target=self.server.serve_forever, name="fake-backend", daemon=True)
+        self.thread.start()
+        return self
+
+    def stop(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+
+def use_fake_backend(port=0):
+    """Start the fake backend and point this process (and xdist workers it spawns) at it"""
+    backend = FakeBackend(port=port).start()
+    os.environ["BASE_URL"] = backend.base_url
+    TestConfig.BASE_URL = backend.base_url
+    TestConfig.API_BASE_URL = f"{backend.base_url}/api"
+    return backend
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Serve the in-memory stand-in backend for local test runs")
+    parser.add_argument("--host", default="127.0.0.1", help="Interface to bind (default: 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8080, help="Port to listen on (default: 8080)")
+    args = parser.parse_args(argv)
+
+    backend = FakeBackend(args.host, args.port)
+    print(f"🧪 Fake backend listening on {backend.base_url} (BASE_URL={backend.base_url})")
+    try:
+        backend.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        backend.server.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
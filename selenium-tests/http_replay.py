@@ -0,0 +1,306 @@
+# HTTP Record/Replay for the Suite's API Traffic
+# Records responses of the suite's requests calls (transport adapter on the shared session)
+# and of the browser's /api fetches (injected interceptor), keyed by method, path and body.
+# In replay mode both are answered from the recordings without contacting a backend.
+import glob
+import json
+import os
+import tempfile
+import threading
+from contextlib import contextmanager
+from urllib.parse import urlsplit
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from config import TestConfig, get_worker_id
+
+try:
+    import fcntl
+except ImportError:  # Windows: no advisory lock, so concurrent recording processes may race
+    fcntl = None
+
+MODES = ('off', 'record', 'replay')
+
+# Browser side. Keys must match recording_key(): "<METHOD> <path?query> <canonical JSON body>".
+# Recorded exchanges and replay positions live in sessionStorage so they survive the
+# navigations inside one test (login form -> dashboard); the pool clears it between tests.
+FETCH_REPLAY_JS = """
+if (!window.__apiReplayInstalled) {
+    window.__apiReplayInstalled = true;
+    const mode = %(mode)s;
+    const recordings = %(recordings)s;
+    const canonical = (value) => {
+        if (Array.isArray(value)) { return '[' + value.map(canonical).join(',') + ']'; }
+        if (value && typeof value === 'object') {
+            return '{' + Object.keys(value).sort().map(k => JSON.stringify(k) + ':' + canonical(value[k])).join(',') + '}';
+        }
+        return JSON.stringify(value);
+    };
+    const bodyKey = (body) => {
+        if (!body) { return ''; }
+        try { return canonical(JSON.parse(body)); } catch (e) { return String(body); }
+    };
+    const load = (name, fallback) => JSON.parse(sessionStorage.getItem(name) || fallback);
+    const originalFetch = window.fetch;
+    window.fetch = function(input, init) {
+        init = init || {};
+        const url = new URL(typeof input === 'string' ? input : input.url, window.location.href);
+        if (url.origin !== window.location.origin || !url.pathname.startsWith('/api/')) {
+            return originalFetch.apply(this, arguments);
+        }
+        const method = (init.method || 'GET').toUpperCase();
+        const key = method + ' ' + url.pathname + url.search + ' ' + bodyKey(init.body);
+        if (mode === 'replay') {
+            const responses = recordings[key] || [];
+            const positions = load('__apiReplayPositions', '{}');
+            const position = positions[key] || 0;
+            positions[key] = position + 1;
+            sessionStorage.setItem('__apiReplayPositions', JSON.stringify(positions));
+            if (!responses.length) {
+                const misses = load('__apiReplayMisses', '[]');
+                misses.push(key);
+                sessionStorage.setItem('__apiReplayMisses', JSON.stringify(misses));
+                return Promise.resolve(new Response(JSON.stringify({error: 'No recording for ' + key}),
+                    {status: 504, headers: {'Content-Type': 'application/json'}}));
+            }
+            const recorded = responses[Math.min(position, responses.length - 1)];
+            return Promise.resolve(new Response(recorded.body,
+                {status: recorded.status, headers: {'Content-Type': recorded.content_type}}));
+        }
+        return originalFetch.apply(this, arguments).then((response) => {
+            response.clone().text().then((text) => {
+                const recorded = load('__apiRecorded', '[]');
+                recorded.push({key: key, status: response.status,
+                               content_type: response.headers.get('Content-Type') || '', body: text});
+                sessionStorage.setItem('__apiRecorded', JSON.stringify(recorded));
+            });
+            return response;
+        });
+    };
+}
+"""
+
+COLLECT_JS = """
+const recorded = JSON.parse(sessionStorage.getItem('__apiRecorded') || '[]');
+const misses = JSON.parse(sessionStorage.getItem('__apiReplayMisses') || '[]');
+sessionStorage.removeItem('__apiRecorded');
+sessionStorage.removeItem('__apiReplayMisses');
+return [recorded, misses];
+"""
+
+
+class NoRecording(requests.ConnectionError):
+    """Replay mode was asked for a request that was never recorded"""
+
+
+def canonical_body(body):
+    """Key-sorted compact JSON for JSON bodies (matches the browser side), else the raw text"""
+    if not body:
+        return ''
+    if isinstance(body, bytes):
+        body = body.decode('utf-8', 'replace')
+    try:
+        return json.dumps(json.loads(body), sort_keys=True, separators=(',', ':'), ensure_ascii=False)
+    except ValueError:
+        return body
+
+
+def recording_key(method, url, body=None):
+    parts = urlsplit(url)
+    path = parts.path + (f"?{parts.query}" if parts.query else '')
+    return f"{method.upper()} {path} {canonical_body(body)}"
+
+
+class RecordingStore:
+    """Recorded responses per key, replayed in recorded order (the last one repeats)"""
+
+    def __init__(self, path=None):
+        self.path = path or TestConfig.RECORDINGS_FILE
+        self._lock = threading.Lock()
+        self._recorded = {}
+        self._positions = {}
+        self.misses = []
+        try:
+            with open(self.path) as f:
+                self.recordings = json.load(f)
+        except (OSError, ValueError):
+            self.recordings = {}
+
+    def add(self, key, status, content_type, body):
+        with self._lock:
+            self._recorded.setdefault(key, []).append(
+                {'status': status, 'content_type': content_type, 'body': body})
+
+    def next_response(self, key):
+        with self._lock:
+            responses = self.recordings.get(key)
+            if not responses:
+                self.misses.append(key)
+                return None
+            position = self._positions.get(key, 0)
+            self._positions[key] = position + 1
+            return responses[min(position, len(responses) - 1)]
+
+    def save(self):
+        """Persist this session's recordings; returns the number of keys.
+
+        An xdist worker writes a part file of its own; the controller (or a serial run)
+        merges every part into the recordings file, see merge_recordings().
+        """
+        with self._lock:
+            recorded = dict(self._recorded)
+        worker_id = get_worker_id()
+        if worker_id != 'main':
+            if recorded:
+                _write_json(worker_part_path(self.path, worker_id), recorded)
+            return len(recorded)
+        return merge_recordings(self.path, recorded)
+
+
+def _write_json(path, data):
+    directory = os.path.dirname(path) or '.'
+    os.makedirs(directory, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, path)
+
+
+@contextmanager
+def _file_lock(path):
+    """Exclusive lock next to path, held by one recording process (e.g. per --browsers run) at a time"""
+    os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+    with open(f"{path}.lock", 'w') as lock:
+        if fcntl is not None:
+            fcntl.flock(lock, fcntl.LOCK_EX)
+        yield  # closing the file releases the lock
+
+
+def worker_part_path(path, worker_id):
+    return f"{path}.{worker_id}.part"
+
+
+def worker_part_files(path):
+    """Part files of xdist workers in worker order (gw0, gw1, ..., gw10)"""
+    parts = glob.glob(worker_part_path(glob.escape(path), 'gw*'))
+    return sorted(parts, key=lambda part: int(part.rsplit('.gw', 1)[1].split('.')[0]))
+
+
+def discard_worker_recordings(path=None):
+    """Remove part files left by an interrupted run before workers start recording"""
+    for part in worker_part_files(path or TestConfig.RECORDINGS_FILE):
+        os.remove(part)
+
+
+def merge_recordings(path=None, recorded=None):
+    """Fold this session's recordings (recorded plus every worker's part file) into the file.
+
+    Responses for a key are concatenated across workers, then replace the key's old
+    responses; keys nobody recorded this session are kept. Returns the number of keys.
+    """
+    path = path or TestConfig.RECORDINGS_FILE
+    with _file_lock(path):
+        parts = worker_part_files(path)
+        fresh = {}
+        for session in [recorded or {}] + [_read_json(part) for part in parts]:
+            for key, responses in session.items():
+                fresh.setdefault(key, []).extend(responses)
+        if fresh:
+            merged = _read_json(path)
+            merged.update(fresh)
+            _write_json(path, merged)
+        for part in parts:
+            os.remove(part)
+    return len(fresh)
+
+
+def _read_json(path):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
+
+class ReplayAdapter(HTTPAdapter):
+    """Transport adapter that records or replays every request made through the session"""
+
+    def __init__(self, store, mode, **kwargs):
+        super().__init__(**kwargs)
+        self.store = store
+        self.mode = mode
+
+    def send(self, request, **kwargs):
+        key = recording_key(request.method, request.url, request.body)
+        if self.mode == 'replay':
+            recorded = self.store.next_response(key)
+            if recorded is None:
+                raise NoRecording(f"No recording for {key}", request=request)
+            return self.build_replayed(request, recorded)
+
+        response = super().send(request, **kwargs)
+        self.store.add(key, response.status_code, response.headers.get('Content-Type', ''), response.text)
+        return response
+
+    def build_replayed(self, request, recorded):
+        response = requests.Response()
+        response.status_code = recorded['status']
+        response.headers = CaseInsensitiveDict({'Content-Type': recorded['content_type']})
+        response._content = recorded['body'].encode('utf-8')
+        response.encoding = 'utf-8'
+        response.url = request.url
+        response.request = request
+        response.reason = 'Replayed'
+        return response
+
+
+def replay_mode():
+    mode = TestConfig.HTTP_REPLAY
+    return mode if mode in MODES else 'off'
+
+
+def browser_replay_script(store):
+    """Interceptor source for the browser; replay mode embeds the recordings themselves"""
+    mode = replay_mode()
+    recordings = store.recordings if mode == 'replay' else {}
+    return FETCH_REPLAY_JS % {'mode': json.dumps(mode), 'recordings': json.dumps(recordings)}
+
+
+def collect_browser_traffic(driver, store):
+    """Move the browser's recorded exchanges into store; returns replay misses seen by the page"""
+    recorded, misses = driver.execute_script(COLLECT_JS)
+    for entry in recorded:
+        store.add(entry['key'], entry['status'], entry['content_type'], entry['body'])
+    store.misses.extend(misses)
+    return misses
+
+
+_store = None
+
+
+def get_store():
+    """Return this worker's recording store, loading the recordings file on first use"""
+    global _store
+    if _store is None:
+        _store = RecordingStore()
+    return _store
+
+
+def shutdown_store():
+    """Persist what this worker recorded and report replay misses.
+
+    On an xdist controller, which makes no requests itself, this merges the workers' parts.
+    """
+    global _store
+    if _store is None:
+        if replay_mode() == 'record' and get_worker_id() == 'main':
+            saved = merge_recordings()
+            if saved:
+                print(f"📼 Recorded {saved} request keys into {TestConfig.RECORDINGS_FILE}")
+        return
+    if replay_mode() == 'record':
+        saved = _store.save()
+        print(f"📼 Recorded {saved} request keys into {_store.path}")
+    if _store.misses:
+        print(f"⚠️ {len(_store.misses)} requests had no recording, e.g. {_store.misses[0]}")
+    _store = None
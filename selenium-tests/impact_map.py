@@ -0,0 +1,206 @@
+# Test Impact Map
+# Records what each test touched (pages and static assets it loaded, /api endpoints it
+# called) and the content hashes of the files behind them when it last passed. A later
+# run can then select only the tests whose files changed since.
+import glob
+import hashlib
+import os
+import threading
+from urllib.parse import urlsplit
+from cache_store import load_json, save_json
+from network_capture import endpoint_key
+
+CACHE_FILE = 'impact.json'
+REPO_ROOT = os.path.normpath(os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+SUITE_DIR = os.path.basename(os.path.dirname(os.path.abspath(__file__)))
+
+# Every API route (and /health) is served by server.js with the dependencies in package.json
+BACKEND_FILES = ('server.js', 'package.json')
+HARNESS = '<harness>'  # the suite's shared code: a change there affects every test
+
+# Installed on every page: remembers pages, same-origin resources and /api fetches in
+# sessionStorage, which survives the navigations within a test (the pool clears it after)
+IMPACT_TRACKER_JS = """
+if (!window.__impactInstalled) {
+    window.__impactInstalled = true;
+    const note = (entry) => {
+        const seen = JSON.parse(sessionStorage.getItem('__impact') || '[]');
+        if (!seen.includes(entry)) {
+            seen.push(entry);
+            sessionStorage.setItem('__impact', JSON.stringify(seen));
+        }
+    };
+    const sameOrigin = (url) => new URL(url, location.href).origin === location.origin;
+    note(location.pathname);
+    const noteResources = () => {
+        for (const entry of performance.getEntriesByType('resource')) {
+            if (sameOrigin(entry.name) && entry.initiatorType !== 'fetch') {
+                note(new URL(entry.name).pathname);
+            }
+        }
+    };
+    // Non-Chromium browsers only get this script after the page has loaded
+    if (document.readyState === 'complete') { noteResources(); }
+    else { window.addEventListener('load', noteResources); }
+    const originalFetch = window.fetch;
+    window.fetch = function(input, init) {
+        const url = new URL(typeof input === 'string' ? input : input.url, location.href);
+        if (url.origin === location.origin) {
+            note(((init && init.method) || 'GET').toUpperCase() + ' ' + url.href);
+        }
+        return originalFetch.apply(this, arguments);
+    };
+}
+"""
+
+COLLECT_JS = """
+const seen = JSON.parse(sessionStorage.getItem('__impact') || '[]');
+sessionStorage.removeItem('__impact');
+return seen;
+"""
+
+
+class ImpactTracker:
+    """What the current test touched, fed by the browser and by the shared requests session"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.touched = set()
+
+    def start_test(self):
+        with self._lock:
+            self.touched = set()
+
+    def note(self, entry):
+        """entry is a page/asset path ('/index.html') or 'METHOD url' for an API call"""
+        if ' ' in entry:
+            method, url = entry.split(' ', 1)
+            entry = endpoint_key(method, url)
+        with self._lock:
+            self.touched.add(entry)
+
+    def note_response(self, response, *args, **kwargs):
+        """requests response hook for the shared session"""
+        self.note(f"{response.request.method} {response.request.url}")
+
+    def collect_browser(self, driver):
+        for entry in driver.execute_script(COLLECT_JS) or []:
+            self.note(entry)
+
+    def finish_test(self):
+        with self._lock:
+            touched, self.touched = sorted(self.touched), set()
+        return touched
+
+
+tracker = ImpactTracker()
+
+
+def static_file(path):
+    """public/ file nginx serves for a path (index login.html, unknown paths fall back to index.html)"""
+    relative = path.lstrip('/') or 'login.html'
+    if relative.endswith('/'):
+        relative += 'login.html'
+    candidate = os.path.join('public', relative)
+    if os.path.isfile(os.path.join(REPO_ROOT, candidate)):
+        return candidate
+    return os.path.join('public', 'index.html')
+
+
+def files_for(nodeid, touched):
+    """Repository files a test depends on, given what it touched"""
+    files = {HARNESS, os.path.join(SUITE_DIR, nodeid.split('::', 1)[0])}
+    for entry in touched:
+        path = entry.split(' ', 1)[1] if ' ' in entry else entry
+        path = urlsplit(path).path
+        if ' ' in entry or path == '/health' or path.startswith('/api/'):
+            files.update(BACKEND_FILES)
+        else:
+            files.add(static_file(path))
+    return files
+
+
+def harness_files():
+    """Shared suite code: every non-test module plus the pinned requirements"""
+    suite = os.path.join(REPO_ROOT, SUITE_DIR)
+    paths = [p for p in glob.glob(os.path.join(suite, '*.py'))
+             if not os.path.basename(p).startswith('test_')]
+    return sorted(paths + [os.path.join(suite, 'requirements.txt')])
+
+
+class FileHasher:
+    """Content hashes, computed once per file per run"""
+
+    def __init__(self):
+        self._hashes = {}
+
+    def __call__(self, relative_path):
+        if relative_path not in self._hashes:
+            if relative_path == HARNESS:
+                digest = hashlib.sha1()
+                for path in harness_files():
+                    digest.update(os.path.basename(path).encode())
+                    digest.update(self._read(path))
+                self._hashes[relative_path] = digest.hexdigest()
+            else:
+                content = self._read(os.path.join(REPO_ROOT, relative_path))
+                self._hashes[relative_path] = hashlib.sha1(content).hexdigest() if content is not None else None
+        return self._hashes[relative_path]
+
+    @staticmethod
+    def _read(path):
+        try:
+            with open(path, 'rb') as f:
+                return f.read()
+        except OSError:
+            return None
+
+
+class ImpactMap:
+    """{nodeid: {'touched': [...], 'files': {path: hash}}} as of each test's last pass"""
+
+    def __init__(self):
+        self.tests = load_json(CACHE_FILE)
+        self.hash = FileHasher()
+
+    def changed_files(self, nodeid):
+        """Files of a known test whose content changed since it last passed; None if unknown"""
+        entry = self.tests.get(nodeid)
+        if entry is None:
+            return None
+        return [path for path, digest in entry['files'].items() if self.hash(path) != digest]
+
+    def is_affected(self, nodeid):
+        changed = self.changed_files(nodeid)
+        return changed is None or bool(changed)
+
+    def record(self, results):
+        """Snapshot {nodeid: touched} for tests that passed; failing tests keep their old entry"""
+        if not results:
+            return
+        merged = load_json(CACHE_FILE)  # re-read: other runs may have saved since we loaded
+        for nodeid, touched in results.items():
+            merged[nodeid] = {
+                'touched': touched,
+                'files': {path: self.hash(path) for path in sorted(files_for(nodeid, touched))},
+            }
+        save_json(CACHE_FILE, merged)
+        self.tests = merged
+
+
+class ImpactRecorder:
+    """pytest plugin (controller only) storing what each passing test touched"""
+
+    def __init__(self, impact_map):
+        self.impact_map = impact_map
+        self.passed = {}
+        self.failed = set()
+
+    def pytest_runtest_logreport(self, report):
+        if report.failed or report.skipped:
+            self.failed.add(report.nodeid)
+        if report.when == 'teardown' and report.nodeid not in self.failed:
+            self.passed[report.nodeid] = dict(report.user_properties).get('touched', [])
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.impact_map.record(self.passed)
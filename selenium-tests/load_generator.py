@@ -0,0 +1,235 @@
+#!/usr/bin/env python3
+"""
+REST API Load Generator for Inventory Management System
+Drives the auth, inventory and health endpoints of server.js with a configurable
+concurrency, request mix and duration over pooled keep-alive connections, and
+reports throughput plus p50/p95/p99 latency per endpoint
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from datetime import datetime
+import aiohttp
+from config import TestConfig
+from perf_stats import percentile
+
+DEFAULT_MIX = "list=40,get=20,update=10,delete=10,login=5,health=15"
+
+SEED_ITEM = {
+    'name': 'Load Test Item',
+    'description': 'Created by load_generator.py',
+    'quantity': 10,
+    'price': 9.99,
+    'category': 'Electronics',
+}
+
+
+class LoadStats:
+    """Latency samples and error counts per endpoint label"""
+
+    def __init__(self):
+        self.latencies = {}
+        self.errors = {}
+
+    def record(self, endpoint, elapsed, ok):
+        self.latencies.setdefault(endpoint, []).append(elapsed)
+        if not ok:
+            self.errors[endpoint] = self.errors.get(endpoint, 0) + 1
+
+    def report(self, duration):
+        rows = {}
+        for endpoint, samples in sorted(self.latencies.items()):
+            rows[endpoint] = {
+                'requests': len(samples),
+                'errors': self.errors.get(endpoint, 0),
+                'rps': round(len(samples) / duration, 1),
+                'p50_ms': round(percentile(samples, 50) * 1000, 1),
+                'p95_ms': round(percentile(samples, 95) * 1000, 1),
+                'p99_ms': round(percentile(samples, 99) * 1000, 1),
+                'max_ms': round(max(samples) * 1000, 1),
+            }
+        return rows
+
+
+class LoadGenerator:
+    """Runs weighted API operations from many coroutines sharing one connection pool"""
+
+    def __init__(self, base_url, concurrency, duration, mix, seed_items):
+        self.base_url = base_url.rstrip('/')
+        self.concurrency = concurrency
+        self.duration = duration
+        self.operations = list(mix.keys())
+        self.weights = list(mix.values())
+        self.seed_items = seed_items
+        self.stats = LoadStats()
+        self.item_ids = []
+        self.token = None
+
+    async def timed(self, session, endpoint, method, path, **kwargs):
+        """Send one request, record its latency under endpoint and return (status, body)"""
+        started = time.perf_counter()
+        try:
+            async with session.request(method, f"{self.base_url}{path}", **kwargs) as response:
+                body = await response.read()
+                ok = response.status < 400
+                status = response.status
+        except (aiohttp.ClientError, asyncio.TimeoutError):
+            # ClientTimeout expiry raises asyncio.TimeoutError, which is not a ClientError
+            body, ok, status = b'', False, None
+        self.stats.record(endpoint, time.perf_counter() - started, ok)
+        return status, body
+
+    def auth_headers(self):
+        return {'Authorization': f'Bearer {self.token}'}
+
+    async def login(self, session):
+        status, body = await self.timed(
+            session, 'POST /api/auth/login', 'POST', '/api/auth/login',
+            json={'username': TestConfig.ADMIN_USERNAME, 'password': TestConfig.ADMIN_PASSWORD},
+        )
+        if status == 200:
+            self.token = json.loads(body)['token']
+        return status
+
+    async def create_item(self, session):
+        status, body = await self.timed(
+            session, 'POST /api/inventory', 'POST', '/api/inventory',
+            json=SEED_ITEM, headers=self.auth_headers(),
+        )
+        return json.loads(body)['_id'] if status == 201 else None
+
+    async def remove_item(self, session, item_id):
+        async with session.delete(f"{self.base_url}/api/inventory/{item_id}", headers=self.auth_headers()) as response:
+            await response.read()
+
+    async def op_list(self, session):
+        await self.timed(session, 'GET /api/inventory', 'GET', '/api/inventory', headers=self.auth_headers())
+
+    async def op_get(self, session):
+        item_id = random.choice(self.item_ids)
+        await self.timed(session, 'GET /api/inventory/:id', 'GET', f'/api/inventory/{item_id}', headers=self.auth_headers())
+
+    async def op_update(self, session):
+        item_id = random.choice(self.item_ids)
+        payload = {**SEED_ITEM, 'quantity': random.randint(0, 100)}
+        await self.timed(session, 'PUT /api/inventory/:id', 'PUT', f'/api/inventory/{item_id}',
+                         json=payload, headers=self.auth_headers())
+
+    async def op_delete(self, session):
+        # Create a throwaway item so the seeded set is never depleted
+        item_id = await self.create_item(session)
+        if item_id:
+            await self.timed(session, 'DELETE /api/inventory/:id', 'DELETE', f'/api/inventory/{item_id}',
+                             headers=self.auth_headers())
+
+    async def op_login(self, session):
+        await self.login(session)
+
+    async def op_health(self, session):
+        await self.timed(session, 'GET /health', 'GET', '/health')
+
+    async def worker(self, session, deadline):
+        while time.perf_counter() < deadline:
+            operation = random.choices(self.operations, weights=self.weights)[0]
+            await getattr(self, f'op_{operation}')(session)
+
+    async def run(self):
+        connector = aiohttp.TCPConnector(limit=self.concurrency, keepalive_timeout=30)
+        timeout = aiohttp.ClientTimeout(total=TestConfig.LONG_WAIT)
+        async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+            if await self.login(session) != 200:
+                raise RuntimeError(f"Login failed against {self.base_url} - is the stack running?")
+
+            print(f"🌱 Seeding {self.seed_items} items...")
+            created = await asyncio.gather(*(self.create_item(session) for _ in range(self.seed_items)))
+            self.item_ids = [item_id for item_id in created if item_id]
+            if not self.item_ids:
+                raise RuntimeError("Could not seed any inventory items")
+
+            try:
+                # Setup requests are not part of the measured window
+                self.stats = LoadStats()
+                print(f"🔥 Running {self.concurrency} concurrent clients for {self.duration}s...")
+                started = time.perf_counter()
+                deadline = started + self.duration
+                await asyncio.gather(*(self.worker(session, deadline) for _ in range(self.concurrency)))
+                elapsed = time.perf_counter() - started
+                report = self.stats.report(elapsed)
+            finally:
+                print("🧹 Removing seeded items...")
+                await asyncio.gather(*(self.remove_item(session, item_id) for item_id in self.item_ids),
+                                     return_exceptions=True)
+        return report, elapsed
+
+
+def parse_mix(value):
+    """Parse 'list=40,get=20,...' into {operation: weight}"""
+    mix = {}
+    for part in value.split(','):
+        name, _, weight = part.partition('=')
+        name = name.strip()
+        if not hasattr(LoadGenerator, f'op_{name}') or not weight.strip().isdigit():
+            raise argparse.ArgumentTypeError(f"Invalid mix entry '{part}'")
+        mix[name] = int(weight)
+    if not any(mix.values()):
+        raise argparse.ArgumentTypeError("Request mix needs at least one non-zero weight")
+    return mix
+
+
+def print_report(report, elapsed):
+    total = sum(row['requests'] for row in report.values())
+    errors = sum(row['errors'] for row in report.values())
+    print("=" * 96)
+    print(f"{'Endpoint':<28}{'Requests':>10}{'Errors':>8}{'RPS':>9}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'max ms':>10}")
+    for endpoint, row in report.items():
+        print(f"{endpoint:<28}{row['requests']:>10}{row['errors']:>8}{row['rps']:>9}"
+              f"{row['p50_ms']:>10}{row['p95_ms']:>10}{row['p99_ms']:>10}{row['max_ms']:>10}")
+    print("=" * 96)
+    print(f"📈 Throughput: {total / elapsed:.1f} req/s over {elapsed:.1f}s ({total} requests, {errors} errors)")
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Load generator for the inventory REST API")
+    parser.add_argument("--base-url", default=TestConfig.BASE_URL, help=f"Target stack (default: {TestConfig.BASE_URL})")
+    parser.add_argument("--concurrency", type=int, default=20, help="Concurrent clients (default: 20)")
+    parser.add_argument("--duration", type=float, default=30, help="Measured duration in seconds (default: 30)")
+    parser.add_argument("--mix", type=parse_mix, default=parse_mix(DEFAULT_MIX),
+                        help=f"Weighted operation mix (default: {DEFAULT_MIX})")
+    parser.add_argument("--seed-items", type=int, default=50, help="Items created up front for get/update (default: 50)")
+    parser.add_argument("--json", dest="json_file", help="Also write the report to this JSON file")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("🚦 Inventory API Load Test")
+    print(f"🎯 Target: {args.base_url}")
+    print("=" * 60)
+
+    generator = LoadGenerator(args.base_url, args.concurrency, args.duration, args.mix, args.seed_items)
+    try:
+        report, elapsed = asyncio.run(generator.run())
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+
+    print_report(report, elapsed)
+    if args.json_file:
+        with open(args.json_file, 'w') as f:
+            json.dump({
+                'target': args.base_url,
+                'concurrency': args.concurrency,
+                'duration': elapsed,
+                'timestamp': datetime.now().isoformat(),
+                'endpoints': report,
+            }, f, indent=2)
+        print(f"💾 Report: {args.json_file}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,124 @@
+# Locator Resolution Registry
+# Probes a list of candidate locators in a single execute_script round trip (no implicit
+# waits) and remembers, per page, which candidate matched so later runs try it first.
+import threading
+from urllib.parse import urlsplit
+from selenium.webdriver.common.by import By
+from cache_store import load_json, save_json
+
+CACHE_FILE = 'locators.json'
+
+# Mirrors Selenium's By strategies closely enough for the selectors used by this suite.
+FIND_JS = """
+const isVisible = (el) => {
+    const style = window.getComputedStyle(el);
+    return el.getClientRects().length > 0 && style.visibility !== 'hidden' && style.display !== 'none';
+};
+const cssEscape = (value) => value.replace(/(["\\\\])/g, '\\\\$1');
+const find = (by, value) => {
+    switch (by) {
+        case 'id': return Array.from(document.querySelectorAll(`[id="${cssEscape(value)}"]`));
+        case 'name': return Array.from(document.querySelectorAll(`[name="${cssEscape(value)}"]`));
+        case 'class name': return Array.from(document.getElementsByClassName(value));
+        case 'tag name': return Array.from(document.getElementsByTagName(value));
+        case 'css selector': return Array.from(document.querySelectorAll(value));
+        case 'link text':
+            return Array.from(document.querySelectorAll('a')).filter(a => a.innerText.trim() === value);
+        case 'partial link text':
+            return Array.from(document.querySelectorAll('a')).filter(a => a.innerText.includes(value));
+        case 'xpath': {
+            const result = document.evaluate(value, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+            const nodes = [];
+            for (let i = 0; i < result.snapshotLength; i++) { nodes.push(result.snapshotItem(i)); }
+            return nodes;
+        }
+    }
+    return [];
+};
+"""
+
+# Evaluates candidates in order and returns [index, matches] for the first one that matches
+PROBE_JS = FIND_JS + """
+const candidates = arguments[0];
+const visibleOnly = arguments[1];
+for (let i = 0; i < candidates.length; i++) {
+    let matches;
+    try { matches = find(candidates[i][0], candidates[i][1]); } catch (e) { matches = []; }
+    if (visibleOnly) { matches = matches.filter(isVisible); }
+    if (matches.length > 0) { return [i, matches]; }
+}
+return [-1, []];
+"""
+
+# Evaluates every locator and returns one [present, visible] pair per locator
+PRESENCE_JS = FIND_JS + """
+return arguments[0].map(([by, value]) => {
+    let matches;
+    try { matches = find(by, value); } catch (e) { matches = []; }
+    return [matches.length > 0, matches.some(isVisible)];
+});
+"""
+
+
+class LocatorRegistry:
+    """Remember which candidate locator matched for each (page, name) pair"""
+
+    def __init__(self):
+        self._choices = load_json(CACHE_FILE)
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def ordered(self, key, candidates):
+        """Candidates with the remembered winner for key moved to the front"""
+        remembered = self._choices.get(key)
+        if remembered is None:
+            return list(candidates)
+        preferred = [c for c in candidates if list(c) == remembered]
+        return preferred + [c for c in candidates if list(c) != remembered]
+
+    def remember(self, key, locator):
+        with self._lock:
+            if self._choices.get(key) == list(locator):
+                self.hits += 1
+                return
+            self.misses += 1
+            # Re-read before writing so parallel workers do not drop each other's entries
+            self._choices = {**load_json(CACHE_FILE), **self._choices, key: list(locator)}
+            save_json(CACHE_FILE, self._choices)
+
+    def find_first(self, driver, name, candidates, visible_only=False):
+        """Return (locator, elements) for the first matching candidate, or (None, [])"""
+        key = f"{urlsplit(driver.current_url).path or '/'}::{name}"
+        ordered = self.ordered(key, candidates)
+        index, elements = driver.execute_script(PROBE_JS, [list(c) for c in ordered], visible_only)
+        if index < 0:
+            return None, []
+        locator = tuple(ordered[index])
+        self.remember(key, locator)
+        return locator, elements
+
+
+def query_presence(driver, locators, visible=False):
+    """Check many locators in one execute_script round trip, without any implicit wait.
+
+    Returns one bool per locator: present (or visible, when visible=True) right now.
+    """
+    results = driver.execute_script(PRESENCE_JS, [list(locator) for locator in locators])
+    return [pair[1] if visible else pair[0] for pair in results]
+
+
+_registry = None
+
+
+def get_registry():
+    """Return this worker's locator registry, loading the on-disk cache on first use"""
+    global _registry
+    if _registry is None:
+        _registry = LocatorRegistry()
+    return _registry
+
+
+def by_name_or_id(*names):
+    """Candidate list probing By.NAME then By.ID for each name, in order"""
+    return [(by, name) for name in names for by in (By.NAME, By.ID)]
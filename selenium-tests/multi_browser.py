@@ -0,0 +1,73 @@
+# Concurrent Multi-Browser Runs
+# Runs the same pytest selection once per browser family, all at the same time. Each browser
+# is a separate pytest process with its own workers, results stream, driver cache and
+# screenshot directory; output lines are prefixed with the browser name.
+import os
+import subprocess
+import sys
+import threading
+import time
+from config import TestConfig
+
+SUPPORTED_BROWSERS = ('chrome', 'firefox', 'edge')
+
+
+def parse_browsers(value):
+    """'chrome,firefox' -> ['chrome', 'firefox']; raises ValueError for unknown names"""
+    browsers = [name.strip().lower() for name in value.split(',') if name.strip()]
+    unknown = [name for name in browsers if name not in SUPPORTED_BROWSERS]
+    if unknown or not browsers:
+        raise ValueError(f"unsupported browser(s): {', '.join(unknown) or value!r}")
+    return list(dict.fromkeys(browsers))
+
+
+def browser_report_name(report_file, browser):
+    base, ext = os.path.splitext(report_file)
+    return f"{base}_{browser}{ext}"
+
+
+def browser_environment(browser):
+    """Environment for one browser's pytest process: its own caches and screenshots"""
+    env = dict(os.environ)
+    env['BROWSER'] = browser
+    env['CACHE_DIR'] = os.path.join(TestConfig.CACHE_DIR, browser)
+    env['SCREENSHOT_DIR'] = os.path.join(TestConfig.SCREENSHOT_DIR, browser)
+    env['PYTHONUNBUFFERED'] = '1'  # relay output line by line while the run is in progress
+    return env
+
+
+def _relay_output(browser, stream, finished):
+    for line in stream:
+        print(f"[{browser}] {line}", end='', flush=True)
+    finished[browser] = time.time()  # output closes when the process exits
+
+
+def run_browsers(browsers, report_file, pytest_args_for):
+    """Run pytest_args_for(browser_report_file) for every browser concurrently.
+
+    Returns {browser: {'exit_code', 'wall_time', 'report'}}.
+    """
+    processes = {}
+    finished = {}
+    for browser in browsers:
+        report = browser_report_name(report_file, browser)
+        process = subprocess.Popen(
+            [sys.executable, '-m', 'pytest', *pytest_args_for(report)],
+            env=browser_environment(browser),
+            stdout=subprocess.PIPE,
+            stderr=subprocess.STDOUT,
+            text=True,
+            bufsize=1,
+        )
+        relay = threading.Thread(target=_relay_output, args=(browser, process.stdout, finished), daemon=True)
+        relay.start()
+        processes[browser] = (process, relay, report, time.time())
+        print(f"🚀 {browser}: pytest started (pid {process.pid})")
+
+    results = {}
+    for browser, (process, relay, report, started) in processes.items():
+        exit_code = process.wait()
+        relay.join()
+        results[browser] = {'exit_code': exit_code, 'wall_time': finished.get(browser, time.time()) - started,
+                            'report': report}
+    return results
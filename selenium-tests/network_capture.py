@@ -0,0 +1,102 @@
+# Browser Network Capture
+# Turns Chrome DevTools performance-log events into per-request timings (DNS, connect,
+# TTFB, download, size) and a per-endpoint latency breakdown for each UI test.
+import json
+import re
+from urllib.parse import urlsplit
+from perf_stats import percentile
+
+LOGGING_PREFS = {'performance': 'ALL'}
+
+# Mongo ObjectIds and numeric ids collapse into one endpoint per route
+ID_SEGMENT = re.compile(r'/(?:[0-9a-f]{24}|\d+)(?=/|$)')
+
+
+def endpoint_key(method, url):
+    """'GET /api/inventory/:id' style key for a request"""
+    path = ID_SEGMENT.sub('/:id', urlsplit(url).path or '/')
+    return f"{method} {path}"
+
+
+def drain_performance_log(driver):
+    """Read (and thereby clear) the browser's buffered performance log entries"""
+    return driver.get_log('performance')
+
+
+def parse_performance_log(entries):
+    """Return one dict per completed request with its timings in milliseconds"""
+    requests = {}
+    for entry in entries:
+        message = json.loads(entry['message'])['message']
+        method, params = message.get('method'), message.get('params', {})
+        request_id = params.get('requestId')
+        if method == 'Network.requestWillBeSent':
+            if params['request']['url'].startswith('data:'):
+                continue
+            requests[request_id] = {
+                'endpoint': endpoint_key(params['request']['method'], params['request']['url']),
+                'url': params['request']['url'],
+                'type': params.get('type'),
+                'started': params['timestamp'],
+            }
+        elif request_id not in requests:
+            continue
+        elif method == 'Network.responseReceived':
+            response = params['response']
+            record = requests[request_id]
+            record['status'] = response.get('status')
+            record['from_cache'] = response.get('fromDiskCache', False)
+            timing = response.get('timing')
+            if timing:
+                # Timing offsets are milliseconds relative to requestTime (seconds); -1 means "not applicable"
+                span = lambda start, end: max(timing[end] - timing[start], 0) if timing[start] >= 0 else 0.0
+                record['dns'] = span('dnsStart', 'dnsEnd')
+                record['connect'] = span('connectStart', 'connectEnd')
+                record['ttfb'] = max(timing['receiveHeadersEnd'] - timing['sendEnd'], 0)
+                record['headers_at'] = timing['requestTime'] + timing['receiveHeadersEnd'] / 1000
+        elif method == 'Network.loadingFinished':
+            record = requests[request_id]
+            record['bytes'] = params.get('encodedDataLength', 0)
+            record['total'] = (params['timestamp'] - record['started']) * 1000
+            if 'headers_at' in record:
+                record['download'] = max(params['timestamp'] - record.pop('headers_at'), 0) * 1000
+            record['done'] = True
+        elif method == 'Network.loadingFailed':
+            requests[request_id]['failed'] = params.get('errorText', 'failed')
+            requests[request_id]['done'] = True
+    return [r for r in requests.values() if r.pop('done', False)]
+
+
+def summarize_by_endpoint(requests):
+    """Aggregate parsed requests into {endpoint: latency breakdown}, slowest total first"""
+    grouped = {}
+    for record in requests:
+        grouped.setdefault(record['endpoint'], []).append(record)
+
+    summary = {}
+    for endpoint, records in grouped.items():
+        totals = [r['total'] for r in records if 'total' in r]
+        mean = lambda key: round(sum(r.get(key, 0) for r in records) / len(records), 1)
+        summary[endpoint] = {
+            'count': len(records),
+            'failed': sum(1 for r in records if 'failed' in r),
+            'total_ms': round(sum(totals), 1),
+            'p50_ms': round(percentile(totals, 50), 1) if totals else None,
+            'max_ms': round(max(totals), 1) if totals else None,
+            'dns_ms': mean('dns'),
+            'connect_ms': mean('connect'),
+            'ttfb_ms': mean('ttfb'),
+            'download_ms': mean('download'),
+            'bytes': sum(r.get('bytes', 0) for r in records),
+        }
+    return dict(sorted(summary.items(), key=lambda kv: -kv[1]['total_ms']))
+
+
+def format_breakdown(summary, limit=5):
+    """One line per endpoint for console output"""
+    return [
+        f"{endpoint}: {stats['count']}x, p50 {stats['p50_ms']}ms (ttfb {stats['ttfb_ms']}ms, "
+        f"download {stats['download_ms']}ms, connect {stats['connect_ms']}ms, dns {stats['dns_ms']}ms), "
+        f"{stats['bytes'] / 1024:.1f} KB"
+        for endpoint, stats in list(summary.items())[:limit]
+    ]
@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Page Load Performance Benchmark for Inventory Management System
+Collects Navigation Timing and Paint Timing data for the main pages over N cold and
+warm cache iterations, reports percentiles and fails on regressions against a baseline
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+from base_test import BaseTest
+from driver_pool import shutdown_pool
+from perf_stats import percentile
+
+# Timings in milliseconds relative to navigation start, read once the load event has finished
+NAVIGATION_TIMING_JS = """
+const nav = performance.getEntriesByType('navigation')[0];
+if (!nav || nav.loadEventEnd === 0) { return null; }
+const fcp = performance.getEntriesByName('first-contentful-paint')[0];
+return {
+    ttfb: nav.responseStart - nav.startTime,
+    dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+    load: nav.loadEventEnd - nav.startTime,
+    first_contentful_paint: fcp ? fcp.startTime : null,
+    transfer_size: nav.transferSize
+};
+"""
+
+METRICS = ["ttfb", "dom_content_loaded", "load", "first_contentful_paint"]
+
+# (label, path, needs login)
+PAGES = [
+    ("home", "/", False),
+    ("login", "/login.html", False),
+    ("register", "/register.html", False),
+    ("inventory", "/index.html", True),  # "/" is login.html (nginx index)
+]
+
+BASELINE_FILE = os.path.join("baselines", "page_performance.json")
+
+
+def collect_page_timings(test):
+    """Wait for the current page's load event and return its Navigation/Paint timings"""
+    return test.wait_until("navigation_timing", lambda d: d.execute_script(NAVIGATION_TIMING_JS))
+
+
+def summarize(samples):
+    """Collapse a list of timing dicts into {metric: {p50, p90, p95, mean}}"""
+    summary = {}
+    for metric in METRICS:
+        values = [sample[metric] for sample in samples if sample.get(metric) is not None]
+        if not values:
+            continue
+        summary[metric] = {
+            "p50": round(percentile(values, 50), 1),
+            "p90": round(percentile(values, 90), 1),
+            "p95": round(percentile(values, 95), 1),
+            "mean": round(statistics.mean(values), 1),
+        }
+    return summary
+
+
+class PagePerformanceBenchmark(BaseTest):
+    """Drives the benchmark with BaseTest's pooled driver, API login and waits"""
+
+    def clear_browser_cache(self):
+        """Drop the HTTP cache so the next load is cold (Chromium only)"""
+        if hasattr(self.driver, "execute_cdp_cmd"):
+            self.driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+            return True
+        return False
+
+    def measure(self, path, cold):
+        if cold and not self.clear_browser_cache():
+            return None
+        self.driver.get(f"{self.config.BASE_URL}{path}")
+        return collect_page_timings(self)
+
+    def run(self, iterations):
+        results = {}
+        for label, path, needs_login in PAGES:
+            if needs_login:
+                self.login_via_api()
+            for mode in ("cold", "warm"):
+                if mode == "warm":
+                    self.measure(path, cold=False)  # prime the cache
+                samples = []
+                for _ in range(iterations):
+                    timings = self.measure(path, cold=(mode == "cold"))
+                    if timings is None:
+                        print(f"ℹ️ Cold cache runs need a Chromium browser, skipping {label}/{mode}")
+                        break
+                    samples.append(timings)
+                if samples:
+                    results[f"{label}/{mode}"] = summarize(samples)
+                    print_summary(f"{label}/{mode}", results[f"{label}/{mode}"])
+        return results
+
+
+def print_summary(key, summary):
+    parts = [f"{metric} p50={stats['p50']:.0f}ms p95={stats['p95']:.0f}ms" for metric, stats in summary.items()]
+    print(f"📊 {key:<20} " + " | ".join(parts))
+
+
+def find_regressions(results, baseline, tolerance, min_delta_ms):
+    """Compare p50 values against the baseline; a regression must exceed both thresholds"""
+    regressions = []
+    for key, summary in results.items():
+        for metric, stats in summary.items():
+            reference = baseline.get(key, {}).get(metric, {}).get("p50")
+            if reference is None:
+                continue
+            delta = stats["p50"] - reference
+            if delta > min_delta_ms and stats["p50"] > reference * (1 + tolerance):
+                regressions.append(f"{key} {metric}: p50 {stats['p50']:.0f}ms vs baseline {reference:.0f}ms (+{delta:.0f}ms)")
+    return regressions
+
+
+def load_baseline():
+    try:
+        with open(BASELINE_FILE) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def save_json(path, data):
+    directory = os.path.dirname(path)
+    if directory:
+        os.makedirs(directory, exist_ok=True)
+    with open(path, "w") as f:
+        json.dump(data, f, indent=2)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Page load performance benchmark (Navigation + Paint Timing)")
+    parser.add_argument("--iterations", type=int, default=5, help="Loads per page and cache mode (default: 5)")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="Allowed relative p50 slowdown (default: 0.2 = 20%%)")
+    parser.add_argument("--min-delta", type=float, default=50, help="Ignore slowdowns smaller than this many ms (default: 50)")
+    parser.add_argument("--update-baseline", action="store_true", help=f"Write this run's results to {BASELINE_FILE}")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("⏱️ Page Load Performance Benchmark")
+    print("=" * 60)
+
+    benchmark = PagePerformanceBenchmark()
+    benchmark.setup_method()
+    try:
+        results = benchmark.run(args.iterations)
+    finally:
+        benchmark.teardown_method()
+        shutdown_pool()
+
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    results_file = f"page_performance_{timestamp}.json"
+    save_json(results_file, results)
+    print(f"💾 Results: {results_file}")
+
+    if args.update_baseline:
+        save_json(BASELINE_FILE, results)
+        print(f"📌 Baseline updated: {BASELINE_FILE}")
+        return 0
+
+    baseline = load_baseline()
+    if baseline is None:
+        print(f"ℹ️ No baseline at {BASELINE_FILE} - run with --update-baseline to create one")
+        return 0
+
+    regressions = find_regressions(results, baseline, args.tolerance, args.min_delta)
+    if regressions:
+        print("❌ Performance regressions detected:")
+        for regression in regressions:
+            print(f"   - {regression}")
+        return 1
+    print("✅ No regressions against baseline")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,10 @@
+# Shared statistics helpers for the benchmark and load tools
+import math
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a non-empty list"""
+    ordered = sorted(values)
+    # ceil, not round: round() is banker's rounding and picks the lower neighbour (p50 of 5 -> 2nd)
+    index = max(0, min(len(ordered) - 1, math.ceil(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
@@ -0,0 +1,125 @@
+# Test Helper Profiling
+# Records where each test spends its time: BaseTest helpers (self time, so nested helpers
+# are not double counted) and raw WebDriver round trips. Summaries are printed per test
+# and, from the results stream, as a "slowest tests" table for the whole run.
+import functools
+import time
+from contextlib import contextmanager
+from result_stream import read_stream
+
+
+class TestProfile:
+    """Per-test timing of helpers and WebDriver commands"""
+
+    __test__ = False  # not a pytest test class
+
+    def __init__(self):
+        self.helpers = {}
+        self.webdriver_calls = 0
+        self.webdriver_seconds = 0.0
+        self._stack = []
+
+    @contextmanager
+    def measure(self, name):
+        """Time a helper; time spent in nested helpers is subtracted from its self time"""
+        self._stack.append(0.0)
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            child_time = self._stack.pop()
+            if self._stack:
+                self._stack[-1] += elapsed
+            stats = self.helpers.setdefault(name, [0, 0.0])
+            stats[0] += 1
+            stats[1] += elapsed - child_time
+
+    def record_command(self, elapsed):
+        self.webdriver_calls += 1
+        self.webdriver_seconds += elapsed
+
+    def as_dict(self):
+        return {
+            'helpers': {name: {'calls': calls, 'seconds': round(seconds, 3)}
+                        for name, (calls, seconds) in self.helpers.items()},
+            'webdriver': {'calls': self.webdriver_calls, 'seconds': round(self.webdriver_seconds, 3)},
+        }
+
+    def summary(self):
+        ranked = sorted(self.helpers.items(), key=lambda kv: -kv[1][1])
+        helpers = ", ".join(f"{name} {seconds:.2f}s ({calls}x)" for name, (calls, seconds) in ranked)
+        return (f"{helpers or 'no helpers'} | WebDriver: {self.webdriver_calls} round trips, "
+                f"{self.webdriver_seconds:.2f}s")
+
+
+def profiled(name=None):
+    """Decorator for BaseTest helpers: records the call under name in self.profile"""
+    def decorator(method):
+        label = name or method.__name__
+
+        @functools.wraps(method)
+        def wrapper(self, *args, **kwargs):
+            profile = getattr(self, 'profile', None)
+            if profile is None:
+                return method(self, *args, **kwargs)
+            with profile.measure(label):
+                return method(self, *args, **kwargs)
+        return wrapper
+    return decorator
+
+
+def instrument_driver(driver):
+    """Wrap driver.execute so every WebDriver round trip is timed into driver.active_profile.
+
+    Pooled drivers serve many tests, so BaseTest points active_profile at the current test.
+    """
+    if getattr(driver, 'active_profile', False) is not False:
+        return driver
+    original_execute = driver.execute
+    driver.active_profile = None
+
+    def execute(driver_command, params=None):
+        started = time.perf_counter()
+        try:
+            return original_execute(driver_command, params)
+        finally:
+            if driver.active_profile is not None:
+                driver.active_profile.record_command(time.perf_counter() - started)
+
+    driver.execute = execute
+    return driver
+
+
+def print_slowest_tests(stream_path, top=10):
+    """Print the top slowest tests of a run and aggregate helper time across all tests"""
+    tests = [r for r in read_stream(stream_path) if r.get('event') == 'test']
+    if not tests:
+        return
+    totals = {}
+    webdriver_calls = webdriver_seconds = 0
+    for test in tests:
+        profile = test.get('profile') or {}
+        for name, stats in profile.get('helpers', {}).items():
+            entry = totals.setdefault(name, [0, 0.0])
+            entry[0] += stats['calls']
+            entry[1] += stats['seconds']
+        webdriver_calls += profile.get('webdriver', {}).get('calls', 0)
+        webdriver_seconds += profile.get('webdriver', {}).get('seconds', 0)
+
+    print(f"🐢 Top {min(top, len(tests))} slowest tests:")
+    for test in sorted(tests, key=lambda t: -t.get('duration', 0))[:top]:
+        phases = test.get('phases', {})
+        helpers = (test.get('profile') or {}).get('helpers', {})
+        ranked = sorted(helpers.items(), key=lambda kv: -kv[1]['seconds'])[:3]
+        where = ", ".join(f"{name} {stats['seconds']:.2f}s" for name, stats in ranked)
+        print(f"   {test.get('duration', 0):7.2f}s  {test['nodeid']}")
+        print(f"            setup {phases.get('setup', 0):.2f}s (driver {phases.get('driver_start', 0):.2f}s), "
+              f"body {phases.get('body', 0):.2f}s (login {phases.get('login', 0):.2f}s), "
+              f"teardown {phases.get('teardown', 0):.2f}s" + (f" | {where}" if where else ""))
+
+    if totals:
+        print("🔎 Time by helper across the run:")
+        for name, (calls, seconds) in sorted(totals.items(), key=lambda kv: -kv[1][1]):
+            print(f"   {name:<22} {seconds:8.2f}s  {calls:5d} calls")
+        print(f"   {'WebDriver round trips':<22} {webdriver_seconds:8.2f}s  {webdriver_calls:5d} calls")
@@ -0,0 +1,74 @@
+# Stack Readiness Gate
+# Polls /health and an authenticated API call with exponential backoff until the app and
+# its database answer, so no browser starts against a stack that is still coming up.
+import time
+import requests
+from api_client import ApiClient
+from config import TestConfig
+
+
+class StackNotReady(Exception):
+    """The application did not become ready before the deadline (or cannot become ready)"""
+
+
+def check_health(client=None):
+    """Return None when /health answers {'status': 'OK'}, else a short reason"""
+    response = (client or ApiClient()).health()
+    if response.status_code != 200:
+        return f"/health returned {response.status_code}"
+    status = response.json().get('status')
+    if status != 'OK':
+        return f"/health reported status '{status}'"
+    return None
+
+
+def gate_client():
+    """Client on a plain session of its own, outside the shared one: under HTTP_REPLAY=record
+    the shared session would record the gate's calls, which replay runs (no gate) never make"""
+    return ApiClient(session=requests.Session())
+
+
+def check_authenticated_call(client=None):
+    """Log in and fetch /auth/me with the token: proves JWT auth works and the API can
+    read users from MongoDB. None when it works"""
+    client = client or gate_client()
+    login = client.login(TestConfig.ADMIN_USERNAME, TestConfig.ADMIN_PASSWORD)
+    if login.status_code in (400, 401):
+        # The database answered and rejected us: retrying will not help
+        raise StackNotReady(f"the stack is up but rejected the test credentials "
+                            f"({login.status_code} {login.text})")
+    if login.status_code != 200:
+        return f"POST /api/auth/login returned {login.status_code}"
+    response = client.me(token=login.json()['token'])
+    if response.status_code != 200:
+        return f"GET /api/auth/me returned {response.status_code}"
+    return None
+
+
+def wait_for_stack(timeout=None, initial_delay=0.5, max_delay=None):
+    """Block until the stack is ready; raise StackNotReady when the deadline passes.
+
+    Returns the number of seconds spent waiting.
+    """
+    timeout = TestConfig.READY_TIMEOUT if timeout is None else timeout
+    max_delay = max_delay or TestConfig.READY_MAX_BACKOFF
+    started = time.time()
+    deadline = started + timeout
+    delay = initial_delay
+    attempt = 0
+    client = gate_client()
+    while True:
+        attempt += 1
+        try:
+            reason = check_health(client) or check_authenticated_call(client)
+        except (requests.RequestException, ValueError) as e:
+            reason = f"{type(e).__name__}: {str(e)[:120]}"
+        if reason is None:
+            return time.time() - started
+
+        remaining = deadline - time.time()
+        if remaining <= 0:
+            raise StackNotReady(f"not ready after {timeout}s and {attempt} attempts (last: {reason})")
+        print(f"⏳ Waiting for {TestConfig.BASE_URL} (attempt {attempt}): {reason}")
+        time.sleep(min(delay, remaining))
+        delay = min(delay * 2, max_delay)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Large-Inventory Rendering Benchmark for Inventory Management System
+Seeds increasing inventory sizes and measures, in the browser, how the logged-in
+dashboard copes: time to first row, full render, JS heap size and long tasks.
+Each run appends its scaling curve to a history file for release-over-release tracking
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+from datetime import datetime
+from selenium.common.exceptions import TimeoutException
+from api_client import ApiClient
+from base_test import BaseTest
+from data_fixtures import InventorySeeder
+from driver_pool import shutdown_pool
+
+DEFAULT_SIZES = "100,1000,10000,50000"
+HISTORY_FILE = os.path.join("baselines", "render_scaling.jsonl")
+
+# Installed before any page script runs: observes long tasks and the inventory list
+RENDER_PROBE_JS = """
+window.__render = {firstRow: null, fullRender: null, longTasks: 0, longTaskMs: 0};
+try {
+    new PerformanceObserver((list) => {
+        for (const entry of list.getEntries()) {
+            window.__render.longTasks++;
+            window.__render.longTaskMs += entry.duration;
+        }
+    }).observe({type: 'longtask', buffered: true});
+} catch (e) {}
+// Watch the whole document: the probe runs before #inventoryList exists
+new MutationObserver((mutations, observer) => {
+    if (window.__render.firstRow === null && document.querySelector('#inventoryList .inventory-item')) {
+        window.__render.firstRow = performance.now();
+        // Two frames later layout and paint of the inserted rows have completed
+        requestAnimationFrame(() => requestAnimationFrame(() => {
+            window.__render.fullRender = performance.now();
+        }));
+        observer.disconnect();
+    }
+}).observe(document.documentElement, {childList: true, subtree: true});
+"""
+
+COLLECT_JS = """
+const r = window.__render;
+if (!r || r.fullRender === null) { return null; }
+const api = performance.getEntriesByType('resource').find(e => e.name.endsWith('/api/inventory'));
+return {
+    api_response_end: api ? api.responseEnd : null,
+    first_row: r.firstRow,
+    full_render: r.fullRender,
+    rows: document.querySelectorAll('#inventoryList .inventory-item').length,
+    js_heap_mb: performance.memory ? performance.memory.usedJSHeapSize / 1048576 : null,
+    long_tasks: r.longTasks,
+    long_task_ms: r.longTaskMs
+};
+"""
+
+
+class RenderBenchmark(BaseTest):
+    """Measures one dashboard load at the current inventory size"""
+
+    def install_probe(self):
+        if not hasattr(self.driver, "execute_cdp_cmd"):
+            raise RuntimeError("The rendering benchmark needs a Chromium browser (BROWSER=chrome or edge)")
+        self.driver.execute_cdp_cmd("Page.addScriptToEvaluateOnNewDocument", {"source": RENDER_PROBE_JS})
+
+    def measure(self, expected_rows):
+        # The dashboard itself: "/" is login.html (nginx index), which never lists items
+        self.driver.get(f"{self.config.BASE_URL}/index.html")
+        timeout = max(self.config.LONG_WAIT, expected_rows / 500)
+        sample = self.wait_until("render", lambda d: d.execute_script(COLLECT_JS), timeout)
+        if sample["rows"] < expected_rows:
+            print(f"⚠️ Rendered {sample['rows']} rows, expected at least {expected_rows}")
+        return sample
+
+
+def median_sample(samples):
+    """Per-metric median over iterations"""
+    merged = {}
+    for key in samples[0]:
+        values = [s[key] for s in samples if s[key] is not None]
+        merged[key] = round(statistics.median(values), 1) if values else None
+    return merged
+
+
+def print_curve(curve):
+    print("=" * 92)
+    print(f"{'Items':>8}{'API done ms':>14}{'First row ms':>14}{'Full render ms':>16}{'Heap MB':>10}{'Long tasks':>12}{'LT ms':>10}")
+    for size, row in curve.items():
+        print(f"{size:>8}{str(row['api_response_end']):>14}{str(row['first_row']):>14}{str(row['full_render']):>16}"
+              f"{str(row['js_heap_mb']):>10}{str(row['long_tasks']):>12}{str(row['long_task_ms']):>10}")
+    print("=" * 92)
+
+
+def parse_args(argv=None):
+    parser = argparse.ArgumentParser(description="Dashboard rendering benchmark at increasing inventory sizes")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"Comma-separated item counts (default: {DEFAULT_SIZES})")
+    parser.add_argument("--iterations", type=int, default=3, help="Dashboard loads per size (default: 3)")
+    parser.add_argument("--label", default="", help="Release or commit label stored with the results")
+    args = parser.parse_args(argv)
+    args.sizes = sorted(int(size) for size in args.sizes.split(","))
+    return args
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    print("🖥️ Large-Inventory Rendering Benchmark")
+    print("=" * 60)
+
+    existing = len(ApiClient().list_items().json())
+    seeder = InventorySeeder()
+    benchmark = RenderBenchmark()
+    benchmark.setup_method()
+    curve = {}
+    try:
+        benchmark.install_probe()
+        benchmark.login_via_api()
+        for size in args.sizes:
+            # Grow the dataset incrementally: each size reuses the items seeded for the previous one
+            missing = size - existing - len(seeder.items)
+            seeder.seed(missing)
+            samples = [benchmark.measure(size) for _ in range(args.iterations)]
+            curve[size] = median_sample(samples)
+            print(f"📊 {size} items: first row {curve[size]['first_row']}ms, full render {curve[size]['full_render']}ms")
+    except RuntimeError as e:
+        print(f"❌ {e}")
+        return 1
+    except TimeoutException:
+        print("❌ The dashboard did not finish rendering in time - is the API token still valid?")
+        return 1
+    finally:
+        benchmark.teardown_method()
+        shutdown_pool()
+        seeder.cleanup()
+
+    print_curve(curve)
+
+    record = {
+        "timestamp": datetime.now().isoformat(),
+        "label": args.label,
+        "browser": benchmark.config.BROWSER,
+        "preexisting_items": existing,
+        "curve": curve,
+    }
+    os.makedirs(os.path.dirname(HISTORY_FILE), exist_ok=True)
+    with open(HISTORY_FILE, "a") as f:
+        f.write(json.dumps(record) + "\n")
+    print(f"💾 Appended scaling curve to {HISTORY_FILE}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
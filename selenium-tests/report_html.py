@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+HTML View for Streaming Test Results
+Builds a lightweight HTML report from a results stream (JSON lines). Screenshots are
+referenced by relative path and lazy-loaded instead of being embedded in the page
+"""
+
+import argparse
+import html
+import os
+import sys
+from result_stream import read_stream
+
+STYLE = """
+body { font-family: -apple-system, Segoe UI, Roboto, sans-serif; margin: 24px; color: #2d3748; }
+table { border-collapse: collapse; width: 100%; font-size: 14px; }
+th, td { border-bottom: 1px solid #e2e8f0; padding: 6px 8px; text-align: left; vertical-align: top; }
+th { background: #f7fafc; }
+.passed { color: #38a169; } .failed, .error { color: #e53e3e; } .skipped { color: #d69e2e; }
+.phases { color: #718096; font-size: 12px; }
+img { max-width: 160px; margin: 2px; border: 1px solid #e2e8f0; }
+.network td, .network th { font-size: 12px; padding: 2px 6px; }
+pre { white-space: pre-wrap; font-size: 12px; background: #fff5f5; padding: 8px; }
+"""
+
+
+def load_results(stream_path):
+    """Split a stream into (test records, session summaries)"""
+    tests, sessions = [], []
+    for record in read_stream(stream_path):
+        if record.get('event') == 'test':
+            tests.append(record)
+        elif record.get('event') == 'session_finish':
+            sessions.append(record)
+    return tests, sessions
+
+
+def render_network(network):
+    """Per-endpoint latency table for a test run with NETWORK_CAPTURE enabled"""
+    if not network:
+        return ""
+    rows = "".join(
+        f"<tr><td>{html.escape(endpoint)}</td><td>{stats['count']}</td><td>{stats['p50_ms']}</td>"
+        f"<td>{stats['max_ms']}</td><td>{stats['dns_ms']}</td><td>{stats['connect_ms']}</td>"
+        f"<td>{stats['ttfb_ms']}</td><td>{stats['download_ms']}</td><td>{stats['bytes'] / 1024:.1f}</td></tr>"
+        for endpoint, stats in network.items()
+    )
+    return (
+        f"<details><summary>network ({sum(s['count'] for s in network.values())} requests)</summary>"
+        "<table class=\"network\"><tr><th>Endpoint</th><th>n</th><th>p50 ms</th><th>max ms</th><th>DNS</th>"
+        f"<th>connect</th><th>TTFB</th><th>download</th><th>KB</th></tr>{rows}</table></details>"
+    )
+
+
+def render_test_row(test, report_dir):
+    outcome = html.escape(test['outcome'])
+    phases = ", ".join(f"{name} {seconds:.2f}s" for name, seconds in test.get('phases', {}).items())
+    helpers = sorted(((test.get('profile') or {}).get('helpers') or {}).items(), key=lambda kv: -kv[1]['seconds'])
+    if helpers:
+        phases += " | " + ", ".join(f"{name} {stats['seconds']:.2f}s" for name, stats in helpers[:3])
+    images = "".join(
+        f'<a href="{html.escape(path)}"><img loading="lazy" src="{html.escape(path)}"></a>'
+        for path in (os.path.relpath(shot, report_dir) for shot in test.get('screenshots', []))
+    )
+    details = ""
+    if test.get('longrepr'):
+        details = f"<details><summary>traceback</summary><pre>{html.escape(test['longrepr'])}</pre></details>"
+    details += render_network(test.get('network'))
+    browser = html.escape(test.get('browser') or '')
+    return (
+        f"<tr><td class=\"{outcome}\">{outcome}</td>"
+        f"<td>{html.escape(test['nodeid'])}{details}</td>"
+        f"<td>{browser}</td><td>{html.escape(test.get('worker', ''))}</td>"
+        f"<td>{test.get('duration', 0):.2f}s<div class=\"phases\">{html.escape(phases)}</div></td>"
+        f"<td>{images}</td></tr>"
+    )
+
+
+def build_html_report(stream_path, output_path):
+    """Render the stream at stream_path into an HTML file at output_path"""
+    tests, sessions = load_results(stream_path)
+    report_dir = os.path.dirname(os.path.abspath(output_path))
+    counts = {}
+    for test in tests:
+        counts[test['outcome']] = counts.get(test['outcome'], 0) + 1
+    summary = ", ".join(f'<span class="{name}">{count} {name}</span>' for name, count in sorted(counts.items()))
+    wall_time = sum(session.get('duration', 0) for session in sessions)
+    rows = "\n".join(render_test_row(test, report_dir) for test in tests)
+
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Test Report - {html.escape(os.path.basename(stream_path))}</title>
+<style>{STYLE}</style></head>
+<body>
+<h1>Inventory Management System - Test Report</h1>
+<p>{len(tests)} tests: {summary}. Wall time {wall_time:.1f}s. Source: {html.escape(os.path.basename(stream_path))}</p>
+<table>
+<tr><th>Outcome</th><th>Test</th><th>Browser</th><th>Worker</th><th>Duration</th><th>Screenshots</th></tr>
+{rows}
+</table>
+</body></html>
+"""
+    with open(output_path, 'w') as f:
+        f.write(page)
+    return output_path
+
+
+def build_comparison_report(results, output_path, related=None):
+    """Side-by-side view of one selection run against several browsers.
+
+    results maps browser -> {'stream', 'report', 'wall_time'} (see multi_browser.run_browsers).
+    related maps a label -> {'stream', 'report'} for browser-independent runs of the same
+    invocation (the API tier), linked above the table with their counts.
+    """
+    report_dir = os.path.dirname(os.path.abspath(output_path))
+    related_links = []
+    for label, run in (related or {}).items():
+        tests, _ = load_results(run['stream']) if os.path.exists(run['stream']) else ([], [])
+        failed = sum(1 for test in tests if test['outcome'] in ('failed', 'error'))
+        link = html.escape(os.path.relpath(run['report'], report_dir))
+        related_links.append(
+            f"<li><a href=\"{link}\">{html.escape(label)}</a>: {len(tests)} tests, "
+            f"<span class=\"{'failed' if failed else 'passed'}\">{failed} failed</span></li>"
+        )
+    by_test = {}
+    header_cells, summary_cells = [], []
+    for browser, result in results.items():
+        tests, _ = load_results(result['stream']) if os.path.exists(result['stream']) else ([], [])
+        failed = sum(1 for test in tests if test['outcome'] in ('failed', 'error'))
+        test_time = sum(test.get('duration', 0) for test in tests)
+        link = html.escape(os.path.relpath(result['report'], report_dir))
+        header_cells.append(f'<th><a href="{link}">{html.escape(browser)}</a></th>')
+        summary_cells.append(
+            f"<td>{len(tests)} tests, <span class=\"{'failed' if failed else 'passed'}\">{failed} failed</span><br>"
+            f"wall {result['wall_time']:.1f}s, test time {test_time:.1f}s</td>"
+        )
+        for test in tests:
+            by_test.setdefault(test['nodeid'], {})[browser] = test
+
+    rows = []
+    for nodeid in sorted(by_test):
+        cells = []
+        for browser in results:
+            test = by_test[nodeid].get(browser)
+            if test is None:
+                cells.append("<td>-</td>")
+            else:
+                outcome = html.escape(test['outcome'])
+                cells.append(f'<td class="{outcome}">{outcome} {test.get("duration", 0):.2f}s</td>')
+        rows.append(f"<tr><td>{html.escape(nodeid)}</td>{''.join(cells)}</tr>")
+
+    related_html = f"<ul>{''.join(related_links)}</ul>" if related_links else ""
+    page = f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>Cross-Browser Test Report</title>
+<style>{STYLE}</style></head>
+<body>
+<h1>Inventory Management System - Cross-Browser Test Report</h1>
+{related_html}
+<table>
+<tr><th>Test</th>{''.join(header_cells)}</tr>
+<tr><td><b>Summary</b></td>{''.join(summary_cells)}</tr>
+{chr(10).join(rows)}
+</table>
+</body></html>
+"""
+    with open(output_path, 'w') as f:
+        f.write(page)
+    return output_path
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build an HTML report from a results stream")
+    parser.add_argument("stream", help="Results stream (.jsonl) written by the test run")
+    parser.add_argument("-o", "--output", help="HTML file to write (default: stream name with .html)")
+    args = parser.parse_args(argv)
+
+    output = args.output or os.path.splitext(args.stream)[0] + ".html"
+    build_html_report(args.stream, output)
+    print(f"📊 Report: {output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
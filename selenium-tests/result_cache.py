@@ -0,0 +1,89 @@
+# Persistent Test Results
+# Remembers each test's last outcome across runs so a fix-and-verify loop can run the
+# previously failing tests first (RERUN_FAILED=first) or only those (RERUN_FAILED=only).
+import json
+import os
+from datetime import datetime
+from cache_store import load_json, save_json
+from config import TestConfig
+
+CACHE_FILE = 'results.json'
+RERUN_MODES = ('off', 'first', 'only')
+FAILING = ('failed', 'error')
+
+
+class ResultCache:
+    """{nodeid: {'outcome', 'timestamp'}} as of each test's most recent run"""
+
+    def __init__(self):
+        self.results = load_json(CACHE_FILE)
+
+    def failed(self):
+        return {nodeid for nodeid, result in self.results.items() if result['outcome'] in FAILING}
+
+    def record(self, outcomes):
+        """Fold {nodeid: outcome} from a finished run in; tests that did not run keep their entry"""
+        if not outcomes:
+            return
+        merged = load_json(CACHE_FILE)  # re-read: another shard or run may have saved since we loaded
+        timestamp = datetime.now().isoformat(timespec='seconds')
+        for nodeid, outcome in outcomes.items():
+            merged[nodeid] = {'outcome': outcome, 'timestamp': timestamp}
+        save_json(CACHE_FILE, merged)
+        self.results = merged
+
+
+def failures_recorded(cache_dirs):
+    """Whether any of these cache directories has a failing test on record"""
+    for cache_dir in cache_dirs:
+        try:
+            with open(os.path.join(cache_dir, CACHE_FILE)) as f:
+                results = json.load(f)
+        except (OSError, ValueError):
+            continue
+        if any(result['outcome'] in FAILING for result in results.values()):
+            return True
+    return False
+
+
+def order_failed_first(items, mode, cache=None):
+    """Apply a rerun mode to collected items in place; returns the items it deselected.
+
+    'first' moves previously failing tests to the front (stable, so the existing class order
+    is kept within both halves). 'only' keeps just those, unless nothing failed last time at
+    all, in which case everything runs. run_tests.py decides that once per invocation
+    (RERUN_FAILED_FOUND), before the API tier rewrites the cache: a tier whose tests all
+    passed then runs nothing while another one is red.
+    """
+    if mode == 'off':
+        return []
+    failed = (cache or ResultCache()).failed()
+    found = TestConfig.RERUN_FAILED_FOUND
+    nothing_failed = found == 'false' if found else not failed
+    if mode == 'first' or nothing_failed:
+        items.sort(key=lambda item: item.nodeid not in failed)
+        return []
+    deselected = [item for item in items if item.nodeid not in failed]
+    items[:] = [item for item in items if item.nodeid in failed]
+    return deselected
+
+
+class ResultRecorder:
+    """pytest plugin (controller only) storing every finished test's outcome"""
+
+    def __init__(self, cache):
+        self.cache = cache
+        self.outcomes = {}
+
+    def pytest_runtest_logreport(self, report):
+        previous = self.outcomes.get(report.nodeid, 'passed')
+        if report.failed:
+            outcome = 'failed' if report.when == 'call' else 'error'
+            self.outcomes[report.nodeid] = previous if previous in FAILING else outcome
+        elif report.skipped and previous == 'passed':
+            self.outcomes[report.nodeid] = 'skipped'
+        else:
+            self.outcomes.setdefault(report.nodeid, previous)
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.cache.record(self.outcomes)
@@ -0,0 +1,78 @@
+# Streaming Test Results
+# pytest plugin that appends one JSON line per finished test while the run is in progress,
+# so results can be followed live (tail -f) and an HTML view built from them later.
+import json
+import os
+import time
+from datetime import datetime
+
+
+class ResultStream:
+    """Writes per-test results (outcome, phase timings, screenshots) as JSON lines"""
+
+    def __init__(self, path):
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.path = path
+        self.file = open(path, 'a', buffering=1)  # line buffered: each result is visible immediately
+        self._entries = {}
+        self.counts = {}
+        self.started = time.time()
+
+    def write(self, record):
+        self.file.write(json.dumps(record, default=str) + '\n')
+
+    def pytest_sessionstart(self, session):
+        self.write({'event': 'session_start', 'timestamp': datetime.now().isoformat(),
+                    'args': session.config.invocation_params.args})
+
+    def pytest_runtest_logreport(self, report):
+        entry = self._entries.setdefault(report.nodeid, {
+            'event': 'test',
+            'nodeid': report.nodeid,
+            'outcome': 'passed',
+            'phases': {},
+        })
+        # setup includes driver start, call is the test body
+        phase = 'body' if report.when == 'call' else report.when
+        entry['phases'][phase] = round(report.duration, 3)
+
+        if report.failed:
+            entry['outcome'] = 'failed' if report.when == 'call' else 'error'
+            entry['longrepr'] = str(report.longrepr)[-4000:]
+        elif report.skipped and entry['outcome'] == 'passed':
+            entry['outcome'] = 'skipped'
+
+        if report.when != 'teardown':
+            return
+
+        properties = dict(report.user_properties)
+        entry['phases'].update(properties.get('phase_timings', {}))
+        entry['screenshots'] = properties.get('screenshots', [])
+        entry['profile'] = properties.get('profile')
+        entry['network'] = properties.get('network')
+        entry['browser_rss_mb'] = properties.get('browser_rss_mb')
+        entry['worker'] = properties.get('worker', 'main')
+        entry['browser'] = properties.get('browser')
+        entry['duration'] = round(sum(entry['phases'].get(p, 0) for p in ('setup', 'body', 'teardown')), 3)
+        entry['timestamp'] = datetime.now().isoformat()
+        self.write(entry)
+        self.counts[entry['outcome']] = self.counts.get(entry['outcome'], 0) + 1
+        del self._entries[report.nodeid]
+
+    def pytest_sessionfinish(self, session, exitstatus):
+        self.write({'event': 'session_finish', 'timestamp': datetime.now().isoformat(),
+                    'exitstatus': int(exitstatus), 'duration': round(time.time() - self.started, 3),
+                    'counts': self.counts})
+        self.file.close()
+
+
+def read_stream(path):
+    """Yield the records of a results stream, skipping a partially written last line"""
+    with open(path) as f:
+        for line in f:
+            try:
+                yield json.loads(line)
+            except ValueError:
+                continue
@@ -4,11 +4,23 @@ Selenium Test Runner for Inventory Management System
 Executes all test suites and generates comprehensive reports
 """
 
+import argparse
 import pytest
 import sys
 import os
 import time
 from datetime import datetime
+from browser_resources import print_memory_summary
+from base_test import BaseTest
+from config import TestConfig
+from fake_backend import use_fake_backend
+from multi_browser import browser_report_name, parse_browsers, run_browsers
+from profiling import print_slowest_tests
+from readiness import StackNotReady, wait_for_stack
+from result_cache import RERUN_MODES, failures_recorded
+from report_html import build_comparison_report, build_html_report
+
+API_TEST_FILE = "test_api_integration.py"
 
 def create_screenshots_directory():
     """Create screenshots directory if it doesn't exist"""
@@ -16,54 +28,205 @@ def create_screenshots_directory():
         os.makedirs('screenshots')
         print("📁 Created screenshots directory")
 
-def run_all_tests():
+def existing_test_files(test_files):
+    """Drop test files that are not present so pytest does not abort the whole run"""
+    present = []
+    for test_file in test_files:
+        if os.path.exists(test_file):
+            present.append(test_file)
+        else:
+            print(f"ℹ️ Skipping missing test file: {test_file}")
+    return present
+
+def stream_name(report_file):
+    """Results stream (JSON lines) that backs an HTML report"""
+    return os.path.splitext(report_file)[0] + ".jsonl"
+
+def build_pytest_args(report_file, test_files, workers=None, shard=None):
+    """Build the pytest argument list, adding xdist and shard options when requested"""
+    pytest_args = [
+        "-v",  # Verbose output
+        "--tb=short",  # Short traceback format
+        f"--results-stream={stream_name(report_file)}",  # Per-test JSON lines, merged across xdist workers
+        "--capture=no",  # Don't capture stdout (show print statements)
+    ]
+    
+    if workers:
+        # One browser per worker process; loadscope keeps each test class on one worker
+        pytest_args.extend(["-n", str(workers), "--dist", "loadscope"])
+    
+    if shard:
+        pytest_args.append(f"--shard={shard}")
+    
+    pytest_args.extend(test_files)
+    return pytest_args
+
+def empty_selection(exit_code):
+    """An empty selection under AFFECTED_ONLY or --last-failed is success, not a failure.
+
+    Nothing changed since the tests last passed, or this tier had no failing tests.
+    """
+    if exit_code != pytest.ExitCode.NO_TESTS_COLLECTED:
+        return exit_code
+    if TestConfig.AFFECTED_ONLY:
+        print("🎯 No affected tests - nothing they depend on changed since they last passed")
+        return 0
+    if TestConfig.RERUN_FAILED == "only":
+        print("🔁 No previously failing tests here")
+        return 0
+    return exit_code
+
+def run_api_tier(report_file):
+    """Run the browser-free API tier into the run's results stream; returns pytest's exit code"""
+    print(f"🔌 Running API tier first: {API_TEST_FILE}")
+    start_time = time.time()
+    exit_code = pytest.main(["-q", "--tb=short", f"--results-stream={stream_name(report_file)}", API_TEST_FILE])
+    print(f"🔌 API tier finished in {time.time() - start_time:.2f} seconds")
+    return empty_selection(exit_code)
+
+def wait_until_ready(timeout):
+    """Gate the run on the stack answering /health and an authenticated API call"""
+    if timeout == 0:
+        return True
+    print("🩺 Waiting for the application stack to become ready...")
+    try:
+        waited = wait_for_stack(timeout)
+    except StackNotReady as e:
+        print(f"❌ Application stack not ready: {e}")
+        print("   Start it (e.g. docker compose up) or point BASE_URL at a running instance")
+        return False
+    print(f"✅ Stack ready after {waited:.1f}s")
+    return True
+
+def start_shared_browser(port):
+    """Launch one Chromium browser that every worker attaches to, isolating tests in contexts"""
+    TestConfig.REMOTE_DEBUGGING_PORT = port
+    launcher = BaseTest()
+    launcher.config = TestConfig()
+    driver = launcher.get_driver()
+    address = f"127.0.0.1:{port}"
+    # xdist workers inherit these from the environment
+    os.environ["SHARED_BROWSER_ADDRESS"] = TestConfig.SHARED_BROWSER_ADDRESS = address
+    os.environ["BROWSER_CONTEXTS"] = "true"
+    TestConfig.BROWSER_CONTEXTS = True
+    print(f"🌐 Shared {TestConfig.BROWSER} browser at {address}: one browser context per test")
+    return driver
+
+def run_browser_tier(report_file, test_files, workers=None, shard=None, browsers=None, shared_browser_port=None):
+    """Run the browser tests, fanning out to one concurrent pytest process per browser.
+
+    With shared_browser_port, the shared browser is launched here, after the readiness gate
+    and the API tier, and quit when the tier is done.
+    Builds the report(s) and returns (exit code, {label: results stream}) for the summaries.
+    """
+    if not browsers or len(browsers) == 1:
+        if browsers:
+            os.environ["BROWSER"] = TestConfig.BROWSER = browsers[0]
+        shared_browser = start_shared_browser(shared_browser_port) if shared_browser_port else None
+        try:
+            exit_code = pytest.main(build_pytest_args(report_file, test_files, workers, shard))
+        finally:
+            if shared_browser is not None:
+                shared_browser.quit()
+        build_html_report(stream_name(report_file), report_file)
+        return empty_selection(exit_code), {TestConfig.BROWSER: stream_name(report_file)}
+    
+    print(f"🌍 Running {', '.join(browsers)} concurrently")
+    results = run_browsers(browsers, report_file,
+                           lambda browser_report: build_pytest_args(browser_report, test_files, workers, shard))
+    streams = {}
+    for browser, result in results.items():
+        result["exit_code"] = empty_selection(result["exit_code"])
+        result["stream"] = streams[browser] = stream_name(result["report"])
+        if os.path.exists(result["stream"]):
+            build_html_report(result["stream"], result["report"])
+        status = "✅" if result["exit_code"] == 0 else "⚠️"
+        print(f"{status} {browser}: exit code {result['exit_code']} in {result['wall_time']:.1f}s - {result['report']}")
+    # The API tier streamed into the run's own stream, which the comparison page replaces
+    api_stream = stream_name(report_file)
+    related = {}
+    if os.path.exists(api_stream):
+        api_report = browser_report_name(report_file, "api")
+        build_html_report(api_stream, api_report)
+        streams = {"api": api_stream, **streams}
+        related["API tier"] = {"stream": api_stream, "report": api_report}
+        print(f"🔌 API tier report: {api_report}")
+    build_comparison_report(results, report_file, related)
+    exit_code = next((r["exit_code"] for r in results.values() if r["exit_code"] != 0), 0)
+    return exit_code, streams
+
+def print_run_summaries(streams, top):
+    """Slowest tests and browser memory, per browser when several ran"""
+    for label, stream in streams.items():
+        if not os.path.exists(stream):
+            continue
+        if len(streams) > 1:
+            print(f"--- {label} ---")
+        if top:
+            print_slowest_tests(stream, top)
+        print_memory_summary(stream)
+
+def report_name(prefix, shard=None):
+    """Timestamped report filename, tagged with the shard when splitting across machines"""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    if shard:
+        prefix = f"{prefix}_shard{shard.replace('/', 'of')}"
+    return f"{prefix}_{timestamp}.html"
+
+def run_all_tests(workers=None, shard=None, top=10, ready_timeout=None, browsers=None, shared_browser_port=None):
     """Run all Selenium test suites"""
     print("🧪 Starting Selenium Test Execution")
     print("=" * 50)
     
+    if not wait_until_ready(ready_timeout):
+        return 1
+    
     # Create screenshots directory
     create_screenshots_directory()
     
     # Test configuration
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = f"test_report_{timestamp}.html"
+    report_file = report_name("test_report", shard)
+    
+    # The API tier gates the browser tier: no browser starts while the API is broken
+    api_exit_code = run_api_tier(report_file)
+    if api_exit_code != 0:
+        print("❌ API tier failed - skipping browser tests")
+        build_html_report(stream_name(report_file), report_file)
+        print(f"📊 Report: {report_file}")
+        return api_exit_code
+    print("=" * 50)
     
-    # Test files to run
+    # Browser test files to run
     test_files = [
         "test_homepage.py",
         "test_authentication.py", 
         "test_inventory_management.py",
-        "test_api_integration.py",
         "test_navigation_and_ui.py",
         "test_advanced_scenarios.py"
     ]
+    test_files = existing_test_files(test_files)
     
     print(f"📋 Test Files to Execute:")
     for i, test_file in enumerate(test_files, 1):
         print(f"   {i}. {test_file}")
     
+    if workers:
+        print(f"⚡ Parallel workers: {workers}")
+    if shard:
+        print(f"🧩 Shard: {shard}")
     print(f"📊 Report will be saved as: {report_file}")
+    print(f"📡 Live results: {stream_name(report_file)}")
     print("=" * 50)
     
-    # Pytest arguments
-    pytest_args = [
-        "-v",  # Verbose output
-        "--tb=short",  # Short traceback format
-        f"--html={report_file}",  # HTML report
-        "--self-contained-html",  # Embed CSS/JS in HTML
-        "--capture=no",  # Don't capture stdout (show print statements)
-    ]
-    
-    # Add test files
-    pytest_args.extend(test_files)
-    
     # Run tests
     start_time = time.time()
-    exit_code = pytest.main(pytest_args)
+    exit_code, streams = run_browser_tier(report_file, test_files, workers, shard, browsers, shared_browser_port)
     end_time = time.time()
     
     # Print summary
     print("=" * 50)
+    print_run_summaries(streams, top)
+    print("=" * 50)
     print(f"🏁 Test Execution Completed")
     print(f"⏱️  Total Time: {end_time - start_time:.2f} seconds")
     print(f"📊 Report: {report_file}")
@@ -76,7 +239,8 @@ def run_all_tests():
     
     return exit_code
 
-def run_specific_test_suite(suite_name):
+def run_specific_test_suite(suite_name, workers=None, shard=None, top=10, ready_timeout=None, browsers=None,
+                            shared_browser_port=None):
     """Run a specific test suite"""
     test_files = {
         "homepage": "test_homepage.py",
@@ -95,37 +259,124 @@ def run_specific_test_suite(suite_name):
     test_file = test_files[suite_name.lower()]
     print(f"🧪 Running {suite_name} test suite: {test_file}")
     
+    if not wait_until_ready(ready_timeout):
+        return 1
+    
     # Create screenshots directory
     create_screenshots_directory()
     
     # Run specific test
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    report_file = f"test_report_{suite_name}_{timestamp}.html"
-    
-    pytest_args = [
-        "-v",
-        "--tb=short",
-        f"--html={report_file}",
-        "--self-contained-html",
-        "--capture=no",
-        test_file
-    ]
-    
-    exit_code = pytest.main(pytest_args)
+    report_file = report_name(f"test_report_{suite_name}", shard)
+    if test_file == API_TEST_FILE:
+        browsers = None  # no browser involved: one run is enough
+        shared_browser_port = None
+    exit_code, streams = run_browser_tier(report_file, [test_file], workers, shard, browsers, shared_browser_port)
+    print_run_summaries(streams, top)
     
     print(f"📊 Report saved as: {report_file}")
     return exit_code
 
+def parse_args(argv=None):
+    """Parse command line options for the runner"""
+    parser = argparse.ArgumentParser(description="Selenium Test Runner for Inventory Management System")
+    parser.add_argument("suite", nargs="?", help="Run a single suite (homepage, auth, inventory, api, navigation, advanced)")
+    parser.add_argument("--workers", help="Number of parallel workers, or 'auto' for one per CPU core")
+    parser.add_argument("--shard", help="Run only shard i of k (e.g. 2/4) to split the suite across CI machines")
+    parser.add_argument("--top", type=int, default=10, help="Print the N slowest tests and where their time went (0 to disable)")
+    parser.add_argument("--backend", choices=["real", "fake"], default=TestConfig.BACKEND,
+                        help="Test against the real stack at BASE_URL or the in-process fake backend (default: BACKEND or real)")
+    parser.add_argument("--http-replay", choices=["off", "record", "replay"], default=TestConfig.HTTP_REPLAY,
+                        help="Record the suite's API traffic, or replay it without a backend (default: HTTP_REPLAY or off)")
+    parser.add_argument("--browsers", help="Comma-separated browsers to run concurrently (e.g. chrome,firefox,edge)")
+    parser.add_argument("--shared-browser", nargs="?", type=int, const=9222, metavar="PORT",
+                        help="Chrome/Edge: run every worker's tests in browser contexts of one shared browser (default port 9222)")
+    parser.add_argument("--ready-timeout", type=int, help="Seconds to wait for the stack before giving up (default: READY_TIMEOUT, 0 to skip)")
+    parser.add_argument("--durations-file", default=TestConfig.DURATIONS_FILE,
+                        help="Shared duration history to balance --shard by predicted time (default: DURATIONS_FILE)")
+    parser.add_argument("--affected-only", action="store_true", default=TestConfig.AFFECTED_ONLY,
+                        help="Run only tests whose pages, API or test code changed since they last passed (default: AFFECTED_ONLY)")
+    parser.add_argument("--full", action="store_true", help="Run every test, overriding --affected-only and AFFECTED_ONLY")
+    rerun = parser.add_mutually_exclusive_group()
+    rerun.add_argument("--failed-first", action="store_const", const="first", dest="rerun_failed",
+                       help="Run the tests that failed last time before all others")
+    rerun.add_argument("--last-failed", action="store_const", const="only", dest="rerun_failed",
+                       help="Run only the tests that failed last time (everything if none did)")
+    args = parser.parse_args(argv)
+    args.rerun_failed = args.rerun_failed or TestConfig.RERUN_FAILED
+    if args.rerun_failed not in RERUN_MODES:
+        parser.error(f"RERUN_FAILED must be one of {', '.join(RERUN_MODES)}")
+    
+    if args.workers and args.workers != "auto":
+        if not args.workers.isdigit() or int(args.workers) < 1:
+            parser.error("--workers must be a positive integer or 'auto'")
+    
+    if args.browsers:
+        try:
+            args.browsers = parse_browsers(args.browsers)
+        except ValueError as e:
+            parser.error(f"--browsers: {e}")
+        if args.shared_browser and len(args.browsers) > 1:
+            parser.error("--shared-browser cannot be combined with several --browsers")
+    
+    if args.shard:
+        index, _, total = args.shard.partition("/")
+        if not (index.isdigit() and total.isdigit() and 1 <= int(index) <= int(total)):
+            parser.error("--shard must look like i/k with 1 <= i <= k")
+    
+    return args
+
 if __name__ == "__main__":
     print("🚀 Selenium Test Runner for Inventory Management System")
     print("=" * 60)
     
-    if len(sys.argv) > 1:
+    args = parse_args()
+    
+    os.environ["HTTP_REPLAY"] = TestConfig.HTTP_REPLAY = args.http_replay
+    if args.http_replay == "replay":
+        # Nothing to wait for: API calls are answered from the recordings and pages come
+        # from the in-process server's copy of public/
+        args.ready_timeout = 0
+        args.backend = "fake"
+        print(f"📼 Replaying recorded API traffic from {TestConfig.RECORDINGS_FILE}")
+    
+    if args.backend == "fake":
+        # Hermetic run: xdist workers inherit BASE_URL from the environment
+        backend = use_fake_backend()
+        print(f"🧪 Using in-process fake backend at {backend.base_url}")
+    
+    # Through the environment so xdist workers and per-browser processes select the same tests
+    if args.durations_file:
+        os.environ["DURATIONS_FILE"] = TestConfig.DURATIONS_FILE = os.path.abspath(args.durations_file)
+    affected_only = args.affected_only and not args.full
+    os.environ["AFFECTED_ONLY"] = "true" if affected_only else "false"
+    TestConfig.AFFECTED_ONLY = affected_only
+    if affected_only:
+        print("🎯 Selecting only tests affected by changes since their last pass")
+    os.environ["RERUN_FAILED"] = TestConfig.RERUN_FAILED = args.rerun_failed
+    if args.rerun_failed != "off":
+        # Decided once, before the API tier rewrites its results: otherwise a fixed API test
+        # would leave no failures on record and the browser tier would run everything
+        cache_dirs = [TestConfig.CACHE_DIR]
+        if args.browsers and len(args.browsers) > 1:
+            cache_dirs += [os.path.join(TestConfig.CACHE_DIR, browser) for browser in args.browsers]
+        found = failures_recorded(cache_dirs)
+        os.environ["RERUN_FAILED_FOUND"] = TestConfig.RERUN_FAILED_FOUND = "true" if found else "false"
+        if not found:
+            print("🔁 No failing tests on record - running everything")
+    if args.rerun_failed == "only" and not args.workers:
+        # Serial: the few failing tests share one warm pooled browser and the cached login
+        print("🔁 Re-running last failed tests in one warm browser")
+    
+    if args.browsers and len(args.browsers) == 1:
+        os.environ["BROWSER"] = TestConfig.BROWSER = args.browsers[0]
+    # The shared browser starts inside the browser tier: never before the stack is ready
+    if args.suite:
         # Run specific test suite
-        suite_name = sys.argv[1]
-        exit_code = run_specific_test_suite(suite_name)
+        exit_code = run_specific_test_suite(args.suite, args.workers, args.shard, args.top, args.ready_timeout,
+                                            args.browsers, args.shared_browser)
     else:
         # Run all tests
-        exit_code = run_all_tests()
+        exit_code = run_all_tests(args.workers, args.shard, args.top, args.ready_timeout, args.browsers,
+                                  args.shared_browser)
     
     sys.exit(exit_code)
\ No newline at end of file
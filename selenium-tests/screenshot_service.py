@@ -0,0 +1,194 @@
+# Asynchronous Screenshot Pipeline
+# Captures PNG bytes on the test thread, then dedupes, downscales and writes them on a
+# background pool. Keeps the screenshots directory under a file-count and size budget.
+import hashlib
+import io
+import itertools
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from config import TestConfig, get_worker_id
+
+try:
+    from PIL import Image
+except ImportError:  # Pillow is optional: fall back to exact-duplicate detection, no resizing
+    Image = None
+
+MODES = ('always', 'on-failure', 'off')
+
+
+def perceptual_hash(png_bytes):
+    """Difference hash (dHash) plus a coarse brightness bucket, since dHash alone cannot tell
+    two flat pages of different colour apart. Falls back to SHA-1 when Pillow is missing."""
+    if Image is None:
+        return hashlib.sha1(png_bytes).hexdigest()
+    image = Image.open(io.BytesIO(png_bytes)).convert('L').resize((9, 8))
+    pixels = list(image.getdata())
+    bits = 0
+    for row in range(8):
+        for col in range(8):
+            bits = (bits << 1) | (pixels[row * 9 + col] > pixels[row * 9 + col + 1])
+    return bits, sum(pixels) // len(pixels) // 16
+
+
+def hash_distance(a, b):
+    """Number of differing dHash bits, or 64 when the frames are clearly different"""
+    if isinstance(a, tuple) and isinstance(b, tuple) and a[1] == b[1]:
+        return bin(a[0] ^ b[0]).count('1')
+    return 0 if a == b else 64
+
+
+class ScreenshotService:
+    """Per-worker screenshot writer with dedup, downscaling, retention and failure-only mode"""
+
+    def __init__(self):
+        self.config = TestConfig()
+        self.mode = self.config.SCREENSHOT_MODE if self.config.SCREENSHOT_MODE in MODES else 'always'
+        self.directory = self.config.SCREENSHOT_DIR
+        worker_id = get_worker_id()
+        if worker_id != 'main':
+            # Parallel runs get one sub-directory per worker so names never collide
+            self.directory = os.path.join(self.directory, worker_id)
+        os.makedirs(self.directory, exist_ok=True)
+        self.executor = ThreadPoolExecutor(max_workers=self.config.SCREENSHOT_WORKERS,
+                                           thread_name_prefix='screenshots')
+        self._sequence = itertools.count(1)
+        self._lock = threading.Lock()
+        self._last_hash = None
+        self._pending = []
+        self._buffered = []
+        self._test_writes = []
+        self.written = 0
+        self.skipped = 0
+
+    def capture(self, driver, name):
+        """Grab the screen now and hand encoding/writing to the background pool.
+
+        Returns the path the screenshot would be written to, or None when capture is off.
+        Whether it really is written (not a duplicate, not dropped in on-failure mode) is
+        only known once end_test() has resolved the test's captures.
+        """
+        if self.mode == 'off':
+            return None
+        png_bytes = driver.get_screenshot_as_png()
+        filename = os.path.join(
+            self.directory, f"{name}_{int(time.time() * 1000)}_{next(self._sequence):04d}.png"
+        )
+        if self.mode == 'on-failure':
+            self._buffered.append((filename, png_bytes))
+        else:
+            self._submit(filename, png_bytes)
+        return filename
+
+    def end_test(self, failed):
+        """Finish the test's captures and return the files that were actually written.
+
+        In on-failure mode the buffered captures are written only if the test failed. Waits
+        for the test's own writes, so reports never link a frame that was deduplicated away.
+        """
+        buffered, self._buffered = self._buffered, []
+        if failed:
+            for filename, png_bytes in buffered:
+                self._submit(filename, png_bytes)
+        writes, self._test_writes = self._test_writes, []
+        written = []
+        for future in writes:
+            try:
+                filename = future.result()
+            except Exception as e:
+                print(f"⚠️ Could not write screenshot: {e}")
+                continue
+            if filename:
+                written.append(filename)
+        # Dedup within one test only: the next test's first frame must be written even if it
+        # matches this test's last one. Safe here, since this test's writes have finished.
+        with self._lock:
+            self._last_hash = None
+        return written
+
+    def _submit(self, filename, png_bytes):
+        future = self.executor.submit(self._write, filename, png_bytes)
+        self._test_writes.append(future)
+        with self._lock:
+            self._pending = [f for f in self._pending if not f.done()] + [future]
+
+    def _write(self, filename, png_bytes):
+        digest = perceptual_hash(png_bytes)
+        with self._lock:
+            duplicate = (self._last_hash is not None
+                         and hash_distance(digest, self._last_hash) <= self.config.SCREENSHOT_DEDUP_DISTANCE)
+            self._last_hash = digest
+            if duplicate:
+                self.skipped += 1
+                return None
+
+        if Image is not None:
+            image = Image.open(io.BytesIO(png_bytes))
+            if image.width > self.config.SCREENSHOT_MAX_WIDTH:
+                height = round(image.height * self.config.SCREENSHOT_MAX_WIDTH / image.width)
+                image = image.resize((self.config.SCREENSHOT_MAX_WIDTH, height))
+            image.save(filename, format='PNG', optimize=True)
+        else:
+            with open(filename, 'wb') as f:
+                f.write(png_bytes)
+        with self._lock:
+            self.written += 1
+        return filename
+
+    def flush(self):
+        """Block until every submitted screenshot has been written"""
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for future in pending:
+            future.result()
+
+    def enforce_retention(self):
+        """Delete the oldest screenshots until the directory fits the count and size limits"""
+        files = []
+        for root, _, names in os.walk(self.config.SCREENSHOT_DIR):
+            for name in names:
+                if name.endswith('.png'):
+                    path = os.path.join(root, name)
+                    stat = os.stat(path)
+                    files.append((stat.st_mtime, stat.st_size, path))
+        files.sort()
+
+        max_bytes = self.config.SCREENSHOT_MAX_MB * 1024 * 1024
+        total_bytes = sum(size for _, size, _ in files)
+        removed = 0
+        while files and (len(files) > self.config.SCREENSHOT_MAX_FILES or total_bytes > max_bytes):
+            _, size, path = files.pop(0)
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass  # another worker got there first
+            total_bytes -= size
+            removed += 1
+        return removed
+
+    def shutdown(self):
+        self.flush()
+        self.executor.shutdown(wait=True)
+        removed = self.enforce_retention()
+        print(f"📸 Screenshots: {self.written} written, {self.skipped} duplicates skipped, "
+              f"{removed} old files pruned ({self.mode} mode)")
+
+
+_service = None
+
+
+def get_screenshot_service():
+    """Return this worker's screenshot service, creating it on first use"""
+    global _service
+    if _service is None:
+        _service = ScreenshotService()
+    return _service
+
+
+def shutdown_screenshot_service():
+    """Finish pending writes and apply retention limits for this worker"""
+    global _service
+    if _service is not None:
+        _service.shutdown()
+        _service = None
@@ -0,0 +1,186 @@
+# Test Case 4: API Integration Tests (no browser)
+import uuid
+import pytest
+from api_auth import get_auth_session
+from api_client import ApiClient
+from config import TestConfig
+from http_replay import replay_mode
+
+MISSING_ITEM_ID = "000000000000000000000000"  # valid ObjectId that never exists
+
+
+def unique_suffix():
+    """Random name suffix; fixed while recording or replaying, since bodies are part of the replay key"""
+    return 'replay' if replay_mode() != 'off' else uuid.uuid4().hex[:8]
+
+
+class TestApiIntegration:
+
+    def setup_method(self):
+        """Setup method called before each test"""
+        self.config = TestConfig()
+        self.api = ApiClient()
+        self.created_ids = []
+
+    def teardown_method(self):
+        """Remove any items a test created"""
+        for item_id in self.created_ids:
+            self.api.delete_item(item_id)
+
+    def authed_api(self):
+        return ApiClient(token=get_auth_session()['token'])
+
+    def create_test_item(self, api, **overrides):
+        item = {**self.config.TEST_INVENTORY_ITEM, 'name': f"API Test {unique_suffix()}", **overrides}
+        item.pop('sku', None)
+        response = api.create_item(item)
+        assert response.status_code == 201, response.text
+        created = response.json()
+        self.created_ids.append(created['_id'])
+        return created
+
+    def test_health_endpoint(self):
+        """Test Case 4.1: Verify /health reports the service is up"""
+        print("\n=== Test Case 4.1: Health Endpoint Test ===")
+
+        response = self.api.health()
+
+        assert response.status_code == 200
+        assert response.json()['status'] == 'OK'
+        print("✅ Health endpoint returned OK")
+
+    def test_register_new_user(self):
+        """Test Case 4.2: Verify registering a new user returns a token"""
+        print("\n=== Test Case 4.2: Register User Test ===")
+
+        suffix = unique_suffix()
+        response = self.api.register(f"apiuser_{suffix}", f"apiuser_{suffix}@example.com", "secret123")
+
+        assert response.status_code == 201, response.text
+        data = response.json()
+        assert data['token']
+        assert data['user']['username'] == f"apiuser_{suffix}"
+        print("✅ New user registered")
+
+        # Same username again must be rejected
+        duplicate = self.api.register(f"apiuser_{suffix}", f"other_{suffix}@example.com", "secret123")
+        assert duplicate.status_code == 400
+        print("✅ Duplicate registration rejected")
+
+    def test_register_validation(self):
+        """Test Case 4.3: Verify registration rejects missing fields and short passwords"""
+        print("\n=== Test Case 4.3: Register Validation Test ===")
+
+        missing = self.api.request('POST', '/auth/register', json={'username': 'incomplete'})
+        assert missing.status_code == 400
+
+        short = self.api.register(f"short_{unique_suffix()}", "short@example.com", "123")
+        assert short.status_code == 400
+        assert "6 characters" in short.json()['error']
+        print("✅ Invalid registrations rejected")
+
+    def test_login_with_valid_credentials(self):
+        """Test Case 4.4: Verify login returns a JWT and the user"""
+        print("\n=== Test Case 4.4: API Login Test ===")
+
+        response = self.api.login(self.config.ADMIN_USERNAME, self.config.ADMIN_PASSWORD)
+
+        assert response.status_code == 200, response.text
+        data = response.json()
+        assert data['token'].count('.') == 2
+        assert data['user']['username'] == self.config.ADMIN_USERNAME
+        print("✅ Login returned token and user")
+
+    @pytest.mark.parametrize("username, password, status", [
+        ("invalid_user", "invalid_password", 401),
+        (TestConfig.ADMIN_USERNAME, "wrong_password", 401),
+        ("", "", 400),
+    ])
+    def test_login_rejected(self, username, password, status):
+        """Test Case 4.5: Verify login rejects bad or missing credentials"""
+        print("\n=== Test Case 4.5: API Invalid Login Test ===")
+
+        response = self.api.login(username, password)
+
+        assert response.status_code == status
+        assert 'token' not in response.json()
+        print(f"✅ Login rejected with {status}")
+
+    def test_me_and_logout(self):
+        """Test Case 4.6: Verify /me and /logout require a valid token"""
+        print("\n=== Test Case 4.6: Current User and Logout Test ===")
+
+        token = get_auth_session()['token']
+
+        me = self.api.me(token=token)
+        assert me.status_code == 200
+        assert me.json()['username'] == self.config.ADMIN_USERNAME
+        assert 'password' not in me.json()
+        print("✅ /me returned the logged in user")
+
+        assert self.api.me().status_code == 401
+        assert self.api.me(token="not-a-jwt").status_code == 403
+        print("✅ /me rejected missing and invalid tokens")
+
+        assert self.api.logout(token=token).status_code == 200
+        assert self.api.logout().status_code == 401
+        print("✅ Logout requires a token")
+
+    def test_inventory_crud_round_trip(self):
+        """Test Case 4.7: Verify create, read, list, update and delete of an item"""
+        print("\n=== Test Case 4.7: Inventory CRUD Round Trip Test ===")
+
+        api = self.authed_api()
+        created = self.create_test_item(api)
+        item_id = created['_id']
+        assert created['quantity'] == int(self.config.TEST_INVENTORY_ITEM['quantity'])
+        assert created['price'] == float(self.config.TEST_INVENTORY_ITEM['price'])
+        print("✅ Item created")
+
+        fetched = api.get_item(item_id)
+        assert fetched.status_code == 200
+        assert fetched.json()['name'] == created['name']
+
+        listed = api.list_items()
+        assert listed.status_code == 200
+        assert item_id in [item['_id'] for item in listed.json()]
+        print("✅ Item readable and listed")
+
+        update = {**{k: created[k] for k in ('name', 'description', 'category')}, 'quantity': 42, 'price': 10.5}
+        updated = api.update_item(item_id, update)
+        assert updated.status_code == 200
+        assert updated.json()['quantity'] == 42
+        assert updated.json()['price'] == 10.5
+        print("✅ Item updated")
+
+        deleted = api.delete_item(item_id)
+        assert deleted.status_code == 200
+        assert deleted.json()['item']['_id'] == item_id
+        self.created_ids.remove(item_id)
+        assert api.get_item(item_id).status_code == 404
+        print("✅ Item deleted")
+
+    def test_create_item_validation(self):
+        """Test Case 4.8: Verify invalid items are rejected"""
+        print("\n=== Test Case 4.8: Inventory Validation Test ===")
+
+        api = self.authed_api()
+
+        missing = api.create_item({'name': 'No details'})
+        assert missing.status_code == 400
+
+        negative = api.create_item({**self.config.TEST_INVENTORY_ITEM, 'quantity': -1})
+        assert negative.status_code == 400
+        print("✅ Invalid items rejected")
+
+    def test_missing_item_returns_404(self):
+        """Test Case 4.9: Verify get, update and delete of a missing item return 404"""
+        print("\n=== Test Case 4.9: Missing Item Test ===")
+
+        api = self.authed_api()
+        update = {**self.config.TEST_INVENTORY_ITEM}
+
+        assert api.get_item(MISSING_ITEM_ID).status_code == 404
+        assert api.update_item(MISSING_ITEM_ID, update).status_code == 404
+        assert api.delete_item(MISSING_ITEM_ID).status_code == 404
+        print("✅ Missing item returns 404")
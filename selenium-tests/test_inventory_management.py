@@ -4,19 +4,21 @@ from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.webdriver.support.ui import Select
 from base_test import BaseTest
-import time
+from locators import by_name_or_id
 
+@pytest.mark.usefixtures("seeded_inventory")
 class TestInventoryManagement(BaseTest):
     
+    # Items created over the API before this class runs (edit/delete need existing rows)
+    SEED_ITEMS = 5
+    
     def login_first(self):
-        """Helper method to login before inventory tests"""
-        self.navigate_to("/login.html")
-        self.safe_send_keys((By.ID, "username"), self.config.ADMIN_USERNAME)
-        self.safe_send_keys((By.ID, "password"), self.config.ADMIN_PASSWORD)
-        
-        login_button = self.wait_for_clickable((By.CSS_SELECTOR, "button[type='submit'], input[type='submit']"))
-        login_button.click()
-        time.sleep(3)
+        """Helper method to login before inventory tests (API token, no login form).
+
+        Tests then open /index.html, the dashboard with #inventoryList: "/" is login.html
+        (nginx index), where the seeded rows are never shown.
+        """
+        self.login_via_api()
     
     def test_inventory_page_loads(self):
         """Test Case 3.1: Verify inventory page loads after login"""
@@ -26,19 +28,20 @@ class TestInventoryManagement(BaseTest):
         self.login_first()
         
         # Navigate to inventory page (may be main page after login)
-        self.navigate_to("/")
-        time.sleep(2)
+        self.navigate_to("/index.html")
         
         # Take screenshot
         self.take_screenshot("inventory_page")
         
         # Check for inventory-related elements
         inventory_indicators = [
-            self.is_element_present((By.ID, "itemForm")),
-            self.is_element_present((By.CSS_SELECTOR, "form")),
-            self.is_element_present((By.CSS_SELECTOR, "input[name='name']")),
-            self.is_element_present((By.CSS_SELECTOR, "input[name='quantity']")),
-            self.is_element_present((By.CSS_SELECTOR, "input[name='price']")),
+            *self.elements_present([
+                (By.ID, "itemForm"),
+                (By.CSS_SELECTOR, "form"),
+                (By.CSS_SELECTOR, "input[name='name']"),
+                (By.CSS_SELECTOR, "input[name='quantity']"),
+                (By.CSS_SELECTOR, "input[name='price']"),
+            ]),
             "inventory" in self.driver.page_source.lower(),
             "add item" in self.driver.page_source.lower(),
             "product" in self.driver.page_source.lower()
@@ -55,8 +58,7 @@ class TestInventoryManagement(BaseTest):
         
         # Login first
         self.login_first()
-        self.navigate_to("/")
-        time.sleep(2)
+        self.navigate_to("/index.html")
         
         # Take screenshot before adding item
         self.take_screenshot("before_add_item")
@@ -72,50 +74,46 @@ class TestInventoryManagement(BaseTest):
         
         filled_fields = 0
         
-        # Try to fill form fields
+        # Try to fill form fields (all candidate names probed in one round trip)
         for field_type, possible_names in form_fields.items():
-            for name in possible_names:
-                elements = self.driver.find_elements(By.NAME, name)
-                if not elements:
-                    elements = self.driver.find_elements(By.ID, name)
-                
-                if elements and elements[0].is_displayed():
-                    try:
-                        if field_type == 'name':
-                            elements[0].clear()
-                            elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['name'])
-                            filled_fields += 1
-                            print(f"✅ Filled {field_type} field")
-                        elif field_type == 'description':
-                            elements[0].clear()
-                            elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['description'])
-                            filled_fields += 1
-                            print(f"✅ Filled {field_type} field")
-                        elif field_type == 'quantity':
-                            elements[0].clear()
-                            elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['quantity'])
-                            filled_fields += 1
-                            print(f"✅ Filled {field_type} field")
-                        elif field_type == 'price':
+            elements = self.find_first(f"form_field_{field_type}", by_name_or_id(*possible_names), visible_only=True)
+            
+            if elements:
+                try:
+                    if field_type == 'name':
+                        elements[0].clear()
+                        elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['name'])
+                        filled_fields += 1
+                        print(f"✅ Filled {field_type} field")
+                    elif field_type == 'description':
+                        elements[0].clear()
+                        elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['description'])
+                        filled_fields += 1
+                        print(f"✅ Filled {field_type} field")
+                    elif field_type == 'quantity':
+                        elements[0].clear()
+                        elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['quantity'])
+                        filled_fields += 1
+                        print(f"✅ Filled {field_type} field")
+                    elif field_type == 'price':
+                        elements[0].clear()
+                        elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['price'])
+                        filled_fields += 1
+                        print(f"✅ Filled {field_type} field")
+                    elif field_type == 'category':
+                        if elements[0].tag_name == 'select':
+                            select = Select(elements[0])
+                            try:
+                                select.select_by_visible_text(self.config.TEST_INVENTORY_ITEM['category'])
+                            except:
+                                select.select_by_index(1)  # Select first option
+                        else:
                             elements[0].clear()
-                            elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['price'])
-                            filled_fields += 1
-                            print(f"✅ Filled {field_type} field")
-                        elif field_type == 'category':
-                            if elements[0].tag_name == 'select':
-                                select = Select(elements[0])
-                                try:
-                                    select.select_by_visible_text(self.config.TEST_INVENTORY_ITEM['category'])
-                                except:
-                                    select.select_by_index(1)  # Select first option
-                            else:
-                                elements[0].clear()
-                                elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['category'])
-                            filled_fields += 1
-                            print(f"✅ Filled {field_type} field")
-                        break
-                    except Exception as e:
-                        print(f"⚠️ Could not fill {field_type} field: {str(e)}")
+                            elements[0].send_keys(self.config.TEST_INVENTORY_ITEM['category'])
+                        filled_fields += 1
+                        print(f"✅ Filled {field_type} field")
+                except Exception as e:
+                    print(f"⚠️ Could not fill {field_type} field: {str(e)}")
         
         # Take screenshot after filling form
         self.take_screenshot("form_filled")
@@ -127,9 +125,9 @@ class TestInventoryManagement(BaseTest):
                 submit_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button")
             
             if submit_buttons:
-                # Click submit
-                submit_buttons[0].click()
-                time.sleep(3)
+                # Click submit and wait for the inventory list to re-render
+                with self.expect_dom_change("#inventoryList"):
+                    submit_buttons[0].click()
                 
                 # Take screenshot after submission
                 self.take_screenshot("after_add_item")
@@ -157,27 +155,24 @@ class TestInventoryManagement(BaseTest):
         
         # Login first
         self.login_first()
-        self.navigate_to("/")
-        time.sleep(2)
+        self.navigate_to("/index.html")
         
         # Take screenshot
         self.take_screenshot("inventory_list")
         
         # Look for inventory list elements
-        list_indicators = [
-            self.driver.find_elements(By.CSS_SELECTOR, "table"),
-            self.driver.find_elements(By.CSS_SELECTOR, ".item"),
-            self.driver.find_elements(By.CSS_SELECTOR, ".product"),
-            self.driver.find_elements(By.CSS_SELECTOR, "ul li"),
-            self.driver.find_elements(By.CSS_SELECTOR, ".inventory-item")
-        ]
+        elements = self.find_first("inventory_list", [
+            (By.CSS_SELECTOR, "table"),
+            (By.CSS_SELECTOR, ".item"),
+            (By.CSS_SELECTOR, ".product"),
+            (By.CSS_SELECTOR, "ul li"),
+            (By.CSS_SELECTOR, ".inventory-item")
+        ])
         
         found_list = False
-        for elements in list_indicators:
-            if elements and len(elements) > 0:
-                found_list = True
-                print(f"✅ Found inventory list with {len(elements)} elements")
-                break
+        if elements:
+            found_list = True
+            print(f"✅ Found inventory list with {len(elements)} elements")
         
         if not found_list:
             # Check if there's text indicating empty list
@@ -198,11 +193,9 @@ class TestInventoryManagement(BaseTest):
         
         # Login first
         self.login_first()
-        self.navigate_to("/")
-        time.sleep(2)
+        self.navigate_to("/index.html")
         
         # Look for search field
-        search_fields = []
         search_selectors = [
             (By.NAME, "search"),
             (By.ID, "search"),
@@ -211,11 +204,7 @@ class TestInventoryManagement(BaseTest):
             (By.CSS_SELECTOR, "input[placeholder*='Search']")
         ]
         
-        for selector in search_selectors:
-            elements = self.driver.find_elements(*selector)
-            if elements and elements[0].is_displayed():
-                search_fields = elements
-                break
+        search_fields = self.find_first("search_field", search_selectors, visible_only=True)
         
         if search_fields:
             # Perform search
@@ -233,7 +222,7 @@ class TestInventoryManagement(BaseTest):
             else:
                 search_fields[0].send_keys("\n")  # Press Enter
             
-            time.sleep(2)
+            self.wait_for_network_idle()
             
             # Take screenshot after search
             self.take_screenshot("search_results")
@@ -248,11 +237,9 @@ class TestInventoryManagement(BaseTest):
         
         # Login first
         self.login_first()
-        self.navigate_to("/")
-        time.sleep(2)
+        self.navigate_to("/index.html")
         
         # Look for edit buttons
-        edit_buttons = []
         edit_selectors = [
             (By.CSS_SELECTOR, "button[onclick*='edit']"),
             (By.CSS_SELECTOR, "a[href*='edit']"),
@@ -262,26 +249,20 @@ class TestInventoryManagement(BaseTest):
             (By.CSS_SELECTOR, "button.edit")
         ]
         
-        for selector in edit_selectors:
-            elements = self.driver.find_elements(*selector)
-            if elements:
-                edit_buttons = elements
-                break
+        edit_buttons = self.find_first("edit_button", edit_selectors)
         
         if edit_buttons and len(edit_buttons) > 0:
-            # Click first edit button
+            # Click first edit button (the item is fetched, then the form is populated)
             edit_buttons[0].click()
-            time.sleep(2)
+            self.wait_for_network_idle()
             
             # Take screenshot of edit form
             self.take_screenshot("edit_form")
             
             # Try to modify a field
-            name_fields = self.driver.find_elements(By.NAME, "name")
-            if not name_fields:
-                name_fields = self.driver.find_elements(By.ID, "name")
+            name_fields = self.find_first("edit_name_field", by_name_or_id("name"), visible_only=True)
             
-            if name_fields and name_fields[0].is_displayed():
+            if name_fields:
                 original_value = name_fields[0].get_attribute("value")
                 name_fields[0].clear()
                 name_fields[0].send_keys(f"{original_value} - Updated")
@@ -289,8 +270,8 @@ class TestInventoryManagement(BaseTest):
                 # Look for update/save button
                 save_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button[type='submit']")
                 if save_buttons:
-                    save_buttons[0].click()
-                    time.sleep(2)
+                    with self.expect_dom_change("#inventoryList"):
+                        save_buttons[0].click()
                     
                     # Take screenshot after update
                     self.take_screenshot("after_edit")
@@ -309,11 +290,9 @@ class TestInventoryManagement(BaseTest):
         
         # Login first
         self.login_first()
-        self.navigate_to("/")
-        time.sleep(2)
+        self.navigate_to("/index.html")
         
         # Look for delete buttons
-        delete_buttons = []
         delete_selectors = [
             (By.CSS_SELECTOR, "button[onclick*='delete']"),
             (By.CSS_SELECTOR, "a[href*='delete']"),
@@ -323,33 +302,27 @@ class TestInventoryManagement(BaseTest):
             (By.CSS_SELECTOR, "button.delete")
         ]
         
-        for selector in delete_selectors:
-            elements = self.driver.find_elements(*selector)
-            if elements:
-                delete_buttons = elements
-                break
+        delete_buttons = self.find_first("delete_button", delete_selectors)
         
         if delete_buttons and len(delete_buttons) > 0:
             # Take screenshot before delete
             self.take_screenshot("before_delete")
             
-            # Click first delete button
-            delete_buttons[0].click()
-            time.sleep(1)
-            
-            # Handle confirmation dialog if present
-            try:
-                alert = self.driver.switch_to.alert
-                alert.accept()
-                print("✅ Confirmed deletion in alert dialog")
-            except:
-                # No alert, look for confirmation button
-                confirm_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button[onclick*='confirm'], .confirm")
-                if confirm_buttons:
-                    confirm_buttons[0].click()
-                    print("✅ Confirmed deletion with button")
-            
-            time.sleep(2)
+            # Click first delete button, confirm, and wait for the list to re-render
+            with self.expect_dom_change("#inventoryList"):
+                delete_buttons[0].click()
+                
+                # Handle confirmation dialog if present
+                alert = self.wait_for_alert()
+                if alert:
+                    alert.accept()
+                    print("✅ Confirmed deletion in alert dialog")
+                else:
+                    # No alert, look for confirmation button
+                    confirm_buttons = self.driver.find_elements(By.CSS_SELECTOR, "button[onclick*='confirm'], .confirm")
+                    if confirm_buttons:
+                        confirm_buttons[0].click()
+                        print("✅ Confirmed deletion with button")
             
             # Take screenshot after delete
             self.take_screenshot("after_delete")